@@ -5,9 +5,14 @@ Contains constants, paths, timezone mappings, and default parameters.
 All configuration should be centralized here to avoid hardcoding values.
 """
 
+import atexit
+import logging
+import logging.handlers
 import os
+import queue
+from types import MappingProxyType
+from functools import lru_cache
 from pathlib import Path
-from dotenv import load_dotenv
 from datetime import time
 
 # Load environment variables from .env file (explicitly from project root)
@@ -16,10 +21,27 @@ _possible_env_paths = [
     Path(__file__).parent.parent / '.env',  # shared/../.env
     Path.cwd() / '.env',  # current working directory
 ]
-for _env_path in _possible_env_paths:
-    if _env_path.exists():
-        load_dotenv(_env_path, override=True)
-        break
+
+# Sentinel set in os.environ after the first load, so module reloads and
+# child processes (which inherit the environment) skip re-parsing .env
+_ENV_LOADED_FLAG = '_Q_TRADING_ENV_LOADED'
+
+
+def _load_env() -> None:
+    """Load the first .env found (dotenv is only imported when needed)."""
+    if os.environ.get(_ENV_LOADED_FLAG):
+        return
+
+    from dotenv import load_dotenv
+
+    for env_path in _possible_env_paths:
+        if env_path.exists():
+            load_dotenv(env_path, override=True)
+            break
+    os.environ[_ENV_LOADED_FLAG] = '1'
+
+
+_load_env()
 
 # ============================================================================
 # DATABASE CONFIGURATION
@@ -34,6 +56,16 @@ DATABASE_CA_CERT_PATH = os.getenv('DATABASE_CA_CERT_PATH')
 if not DATABASE_CA_CERT_PATH:
     raise ValueError("DATABASE_CA_CERT_PATH not set in .env file")
 
+# Connection pool: keeps warm (TLS-authenticated) connections between queries.
+# pool_pre_ping drops connections the server closed; pool_recycle (seconds)
+# replaces them before idle timeouts on managed Postgres
+DB_POOL_CONFIG = {
+    'pool_size': 5,
+    'max_overflow': 10,
+    'pool_pre_ping': True,
+    'pool_recycle': 1800,
+}
+
 
 # ============================================================================
 # LOGGING CONFIGURATION
@@ -41,6 +73,55 @@ if not DATABASE_CA_CERT_PATH:
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 LOGS_DIR = Path(__file__).parent.parent / 'logs'
 LOGS_DIR.mkdir(exist_ok=True)
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+def setup_logger(name: str, log_filename: str) -> logging.Logger:
+    """
+    Configure a module logger with console and file output.
+
+    Console output is written synchronously. File writes go through a
+    queue to a background listener thread, so logging inside fetch/process
+    loops never blocks on disk I/O. Handlers are attached once; module
+    reloads (e.g. notebook autoreload) would otherwise duplicate every line.
+
+    Args:
+        name (str): Logger name (the module's __name__)
+        log_filename (str): File name inside LOGS_DIR
+
+    Returns:
+        logging.Logger: Configured logger
+    """
+    level = getattr(logging, LOG_LEVEL)
+    logger = logging.getLogger(name)
+    logger.setLevel(level)
+    # Own handlers below; don't also emit through root handlers (double logging)
+    logger.propagate = False
+
+    if not logger.handlers:
+        formatter = logging.Formatter(LOG_FORMAT)
+
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(level)
+        console_handler.setFormatter(formatter)
+        logger.addHandler(console_handler)
+
+        file_handler = logging.FileHandler(LOGS_DIR / log_filename)
+        file_handler.setLevel(level)
+        file_handler.setFormatter(formatter)
+
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, file_handler)
+        listener.start()
+        # Flush pending records on interpreter exit
+        atexit.register(listener.stop)
+
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setLevel(level)
+        logger.addHandler(queue_handler)
+
+    return logger
+
 
 # ============================================================================
 # SYMBOL AND ASSET CONFIGURATION
@@ -171,26 +252,45 @@ TRADFI_SYMBOLS = {
 
 CRYPTO_SYMBOLS = {'ethusdt', 'btcusdt'}
 
+# Single symbol -> asset type lookup ('tradfi' / 'crypto')
+_SYMBOL_TYPE = MappingProxyType({
+    symbol: info['asset_type']
+    for symbol, info in SYMBOLS.items()
+})
+
+DEFAULT_CRYPTO_EXCHANGE = 'binance'
+
 AVAILABLE_TIMEFRAMES = ['m1', 'm5', 'h1']
 
 # ============================================================================
 # TIMEZONE MAPPING (for convenience)
 # ============================================================================
-INSTRUMENT_TIMEZONES = {
+# Read-only views: these mappings are derived from SYMBOLS and never mutated
+INSTRUMENT_TIMEZONES = MappingProxyType({
     symbol: SYMBOLS[symbol]['timezone']
     for symbol in SYMBOLS
-}
+})
 
 # ============================================================================
 # MARKET HOURS MAPPING (for convenience)
 # ============================================================================
-MARKET_HOURS = {
-    symbol: {
+MARKET_HOURS = MappingProxyType({
+    symbol: MappingProxyType({
         'open': SYMBOLS[symbol]['market_open'],
         'close': SYMBOLS[symbol]['market_close'],
-    }
+    })
     for symbol in SYMBOLS
-}
+})
+
+# Market hours as (open, close) seconds-of-day integers, so filters can
+# compare plain ints instead of datetime.time objects
+MARKET_HOURS_SECONDS = MappingProxyType({
+    symbol: (
+        hours['open'].hour * 3600 + hours['open'].minute * 60 + hours['open'].second,
+        hours['close'].hour * 3600 + hours['close'].minute * 60 + hours['close'].second,
+    )
+    for symbol, hours in MARKET_HOURS.items()
+})
 
 # ============================================================================
 # DATA RETRIEVAL DEFAULTS
@@ -200,12 +300,24 @@ DEFAULT_DATA_CONFIG = {
     'local_time': False,
 }
 
+# Rows per round-trip when streaming OHLCV from the database
+FETCH_BATCH_SIZE = 50_000
+
+# Seconds that table lists, availability checks and date ranges are reused
+# before querying the database again (new data is only visible after this,
+# or after database_connector.invalidate_metadata_cache())
+METADATA_CACHE_TTL_SECONDS = 300
+
 # ============================================================================
 # DATA CLEANING CONFIGURATION
 # ============================================================================
 # Outlier detection thresholds
 OUTLIER_THRESHOLD_MAD = 3.0  # Median Absolute Deviation multiplier (e.g., median ± 3*MAD)
 OUTLIER_THRESHOLD_IQR = 1.5  # Interquartile Range multiplier (e.g., 1.5*IQR)
+# Above OUTLIER_EXACT_MAX_ROWS rows, outlier bounds (median/quartiles/MAD) are
+# estimated on a seeded random sample of OUTLIER_SAMPLE_SIZE rows
+OUTLIER_EXACT_MAX_ROWS = 100_000
+OUTLIER_SAMPLE_SIZE = 50_000
 
 # MICE Imputation configuration
 MICE_CONFIG = {
@@ -213,8 +325,15 @@ MICE_CONFIG = {
     'random_state': 42,
     'verbose': 0,
     'estimator': None,  # Uses default BayesianRidge
+    'tol': 1e-3,  # Early exit once max abs change between rounds < tol (relative)
+    'skip_complete': True,  # Don't fit regressors for columns with no NaN
 }
 
+# Imputation method selection
+# Below this percentage of missing cells, gaps are filled by time-weighted
+# linear interpolation; at or above it, MICE is used. Set to 0 to always use MICE.
+IMPUTATION_INTERPOLATE_MAX_PCT = 1.0
+
 # Gap tolerance for imputation
 # Warn if missing data exceeds this percentage
 GAP_TOLERANCE_PERCENT = 30.0
@@ -256,6 +375,7 @@ for directory in [DATA_DIR, CACHE_DIR, RESULTS_DIR]:
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
+@lru_cache(maxsize=None)
 def get_symbol_info(symbol: str) -> dict:
     """
     Get metadata for a symbol.
@@ -281,12 +401,12 @@ def get_symbol_info(symbol: str) -> dict:
 
 def is_tradfi_symbol(symbol: str) -> bool:
     """Check if symbol is TradFi (not crypto)."""
-    return symbol.lower() in TRADFI_SYMBOLS
+    return _SYMBOL_TYPE.get(symbol.lower()) == 'tradfi'
 
 
 def is_crypto_symbol(symbol: str) -> bool:
     """Check if symbol is cryptocurrency."""
-    return symbol.lower() in CRYPTO_SYMBOLS
+    return _SYMBOL_TYPE.get(symbol.lower()) == 'crypto'
 
 
 # ============================================================================
@@ -327,6 +447,9 @@ def get_table_name(symbol: str, timeframe: str, exchange: str = None) -> str:
     """
     Generate table name from symbol and timeframe.
 
+    Known (symbol, timeframe) combinations are served from a table built at
+    import time; anything else goes through the validating slow path.
+
     Args:
         symbol (str): Symbol name
         timeframe (str): Timeframe (m1, m5, h1)
@@ -341,20 +464,47 @@ def get_table_name(symbol: str, timeframe: str, exchange: str = None) -> str:
     symbol_lower = symbol.lower()
     timeframe_lower = timeframe.lower()
 
-    if symbol_lower not in SYMBOLS:
+    table_name = _TABLE_NAME_CACHE.get((symbol_lower, timeframe_lower, exchange))
+    if table_name is not None:
+        return table_name
+
+    return _build_table_name(symbol_lower, timeframe_lower, exchange)
+
+
+@lru_cache(maxsize=None)
+def _build_table_name(symbol: str, timeframe: str, exchange: str = None) -> str:
+    """Validate and format a table name (expects lowercase symbol/timeframe)."""
+    if symbol not in SYMBOLS:
         raise ValueError(f"Unknown symbol: {symbol}")
 
-    if timeframe_lower not in AVAILABLE_TIMEFRAMES:
+    if timeframe not in AVAILABLE_TIMEFRAMES:
         raise ValueError(
             f"Unknown timeframe: {timeframe}. "
             f"Available: {', '.join(AVAILABLE_TIMEFRAMES)}"
         )
 
-    if is_tradfi_symbol(symbol_lower):
-        return f"{symbol_lower}_{timeframe_lower}_tradfi_ohlcv"
-    elif is_crypto_symbol(symbol_lower):
+    symbol_type = _SYMBOL_TYPE.get(symbol)
+    if symbol_type == 'tradfi':
+        return f"{symbol}_{timeframe}_tradfi_ohlcv"
+    elif symbol_type == 'crypto':
         if not exchange:
-            exchange = 'binance'  # Default exchange for crypto
-        return f"{symbol_lower}_{timeframe_lower}_{exchange}_crypto_ohlcv"
+            exchange = DEFAULT_CRYPTO_EXCHANGE
+        # Table names are interpolated into SQL; only plain words are allowed
+        elif not (exchange.isascii() and exchange.isalnum()):
+            raise ValueError(f"Invalid exchange: {exchange!r}")
+        return f"{symbol}_{timeframe}_{exchange}_crypto_ohlcv"
     else:
         raise ValueError(f"Symbol type unknown: {symbol}")
+
+
+# Precomputed table names for every known (symbol, timeframe) pair
+_TABLE_NAME_CACHE = {}
+for _symbol, _symbol_type in _SYMBOL_TYPE.items():
+    for _timeframe in AVAILABLE_TIMEFRAMES:
+        _TABLE_NAME_CACHE[(_symbol, _timeframe, None)] = _build_table_name(
+            _symbol, _timeframe
+        )
+        if _symbol_type == 'crypto':
+            _TABLE_NAME_CACHE[(_symbol, _timeframe, DEFAULT_CRYPTO_EXCHANGE)] = (
+                _TABLE_NAME_CACHE[(_symbol, _timeframe, None)]
+            )
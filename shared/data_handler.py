@@ -6,37 +6,45 @@ Handles complete data pipeline:
 - Process and clean data
 - Analyze and handle gaps
 - Return analysis-ready data
+- Optionally cache cleaned results to parquet for repeat requests
 
 All data quality checks happen here.
 Notebooks receive clean, validated data only.
 """
 
-import logging
-from typing import Tuple
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Tuple
+import numpy as np
 import pandas as pd
-from shared.database_connector import fetch_ohlcv
+from shared import data_module
+from shared.database_connector import fetch_ohlcv, month_start, utc_timestamp
 from shared.data_module import process_data
-from shared.config import LOG_LEVEL, LOGS_DIR
+from shared.config import (
+    CACHE_DIR,
+    GAP_TOLERANCE_PERCENT,
+    IMPUTATION_INTERPOLATE_MAX_PCT,
+    MARKET_HOLIDAYS,
+    MICE_CONFIG,
+    OUTLIER_EXACT_MAX_ROWS,
+    OUTLIER_SAMPLE_SIZE,
+    OUTLIER_THRESHOLD_IQR,
+    OUTLIER_THRESHOLD_MAD,
+    get_symbol_info,
+    setup_logger,
+)
 
 # ============================================================================
 # LOGGING CONFIGURATION
 # ============================================================================
-logger = logging.getLogger(__name__)
-logger.setLevel(getattr(logging, LOG_LEVEL))
+logger = setup_logger(__name__, 'data_handler.log')
 
-console_handler = logging.StreamHandler()
-console_handler.setLevel(getattr(logging, LOG_LEVEL))
-formatter = logging.Formatter(
-    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-console_handler.setFormatter(formatter)
-logger.addHandler(console_handler)
 
-log_file = LOGS_DIR / 'data_handler.log'
-file_handler = logging.FileHandler(log_file)
-file_handler.setLevel(getattr(logging, LOG_LEVEL))
-file_handler.setFormatter(formatter)
-logger.addHandler(file_handler)
+# Candle length in minutes per timeframe (gap analysis)
+_TIMEFRAME_MINUTES = {'m1': 1, 'm5': 5, 'm15': 15, 'h1': 60, 'd1': 1440}
+_NS_PER_MINUTE = 60 * 1_000_000_000
 
 
 # ============================================================================
@@ -49,6 +57,8 @@ def get_clean_market_data(
     end_date,
     local_time: bool = True,
     exclude_news: bool = False,
+    use_cache: bool = False,
+    use_ohlcv_cache: bool = False,
 ) -> Tuple[pd.DataFrame, dict]:
     """
     Complete data pipeline: fetch -> process -> validate -> return clean data.
@@ -63,6 +73,13 @@ def get_clean_market_data(
         end_date: End datetime
         local_time (bool): Convert to local timezone (default: True)
         exclude_news (bool): Filter out news dates (default: False)
+        use_cache (bool): Reuse/store cleaned results in CACHE_DIR as parquet
+                          (default: False). Entries are keyed on the UTC
+                          range and the cleaning configuration; ranges that
+                          reach the current month are never stored
+        use_ohlcv_cache (bool): Serve completed months of raw data from the
+                                OHLCV cache (fetch_ohlcv(use_cache=True),
+                                default: False)
 
     Returns:
         tuple: (df_clean, metadata_dict)
@@ -74,9 +91,19 @@ def get_clean_market_data(
         f"start={start_date}, end={end_date}"
     )
 
+    if use_cache:
+        cache_path = _cache_path(
+            symbol, timeframe, start_date, end_date, local_time, exclude_news
+        )
+        cached = _load_cached(cache_path)
+        if cached is not None:
+            return cached
+
     # Step 1: Fetch raw data
     logger.info("Step 1: Fetching raw data from database...")
-    df_raw = fetch_ohlcv(symbol, timeframe, start_date, end_date)
+    df_raw = fetch_ohlcv(
+        symbol, timeframe, start_date, end_date, use_cache=use_ohlcv_cache
+    )
     logger.info(f"[OK] Fetched {len(df_raw)} candles (raw, all hours)")
 
     # Step 2: Process data (timezone conversion, filtering, cleaning)
@@ -97,8 +124,15 @@ def get_clean_market_data(
 
     # Step 4: Validate no NaN values
     logger.info("Step 4: Validating no missing values...")
-    missing_counts = df_clean.isnull().sum()
-    if missing_counts.sum() > 0:
+    # Fast path: one NaN reduction over the numeric buffer; per-column counts
+    # are only computed when something is actually missing
+    numeric = df_clean.select_dtypes('number')
+    has_missing = np.isnan(numeric.to_numpy(dtype=float, na_value=np.nan)).any()
+    if not has_missing and numeric.shape[1] < df_clean.shape[1]:
+        has_missing = df_clean.drop(columns=numeric.columns).isna().to_numpy().any()
+
+    if has_missing:
+        missing_counts = df_clean.isna().sum()
         logger.warning(f"Found {missing_counts.sum()} NaN values after cleaning")
         logger.warning(f"Missing by column:\n{missing_counts[missing_counts > 0]}")
     else:
@@ -108,6 +142,10 @@ def get_clean_market_data(
         f"[OK] Data handler complete: {len(df_clean)} analysis-ready candles"
     )
 
+    # A range reaching the current month is still growing: don't freeze it
+    if use_cache and utc_timestamp(end_date) < _current_month():
+        _save_cache(cache_path, df_clean, metadata)
+
     return df_clean, metadata
 
 
@@ -132,17 +170,19 @@ def _analyze_data_quality(
     Returns:
         dict: Metadata with gap analysis
     """
+    # Spans are computed on int64 nanoseconds (no Timedelta boxing)
+    expected_minutes = _TIMEFRAME_MINUTES.get(timeframe.lower(), 60)
+    ns_per_candle = expected_minutes * _NS_PER_MINUTE
+
     # Raw data gap analysis (context only)
-    expected_raw = (df_raw.index[-1] - df_raw.index[0]).total_seconds() / 60
-    freq_map = {'m1': 1, 'm5': 5, 'm15': 15, 'h1': 60, 'd1': 1440}
-    expected_minutes = freq_map.get(timeframe.lower(), 60)
-    expected_raw_candles = (expected_raw / expected_minutes) + 1
+    raw_ns = df_raw.index.as_unit('ns').asi8
+    expected_raw_candles = float(raw_ns[-1] - raw_ns[0]) / ns_per_candle + 1
     actual_raw = len(df_raw)
     gap_raw = ((expected_raw_candles - actual_raw) / expected_raw_candles * 100)
 
     # Clean data gap analysis (meaningful metric)
-    expected_clean = (df_clean.index[-1] - df_clean.index[0]).total_seconds() / 60
-    expected_clean_candles = (expected_clean / expected_minutes) + 1
+    clean_ns = df_clean.index.as_unit('ns').asi8
+    expected_clean_candles = float(clean_ns[-1] - clean_ns[0]) / ns_per_candle + 1
     actual_clean = len(df_clean)
     gap_clean = (
         ((expected_clean_candles - actual_clean) / expected_clean_candles * 100)
@@ -172,5 +212,116 @@ def _analyze_data_quality(
     return metadata
 
 
+# ============================================================================
+# RESULT CACHE
+# ============================================================================
+def _cache_path(
+    symbol: str,
+    timeframe: str,
+    start_date,
+    end_date,
+    local_time: bool,
+    exclude_news: bool,
+) -> Path:
+    """
+    Build the parquet cache path for a get_clean_market_data() call.
+
+    Dates are normalized to UTC nanoseconds, so equal instants given as
+    strings, datetimes or Timestamps share an entry. The cleaning
+    fingerprint changes whenever the config or processing code does.
+    """
+    key = hashlib.blake2b(
+        json.dumps([
+            symbol.lower(),
+            timeframe.lower(),
+            utc_timestamp(start_date).value,
+            utc_timestamp(end_date).value,
+            local_time,
+            exclude_news,
+            _cleaning_fingerprint(symbol, exclude_news),
+        ]).encode()
+    ).hexdigest()[:16]
+    return CACHE_DIR / f"{symbol.lower()}_{timeframe.lower()}_{key}.parquet"
+
+
+def _cleaning_fingerprint(symbol: str, exclude_news: bool) -> str:
+    """Hash of everything besides the raw data that shapes a cleaned frame."""
+    settings = {
+        'code': _processing_code_hash(),
+        'symbol': get_symbol_info(symbol),
+        'mice': MICE_CONFIG,
+        'interpolate_max_pct': IMPUTATION_INTERPOLATE_MAX_PCT,
+        'outliers': [
+            OUTLIER_THRESHOLD_MAD,
+            OUTLIER_THRESHOLD_IQR,
+            OUTLIER_EXACT_MAX_ROWS,
+            OUTLIER_SAMPLE_SIZE,
+        ],
+        'gap_tolerance': GAP_TOLERANCE_PERCENT,
+        'holidays': sorted(MARKET_HOLIDAYS),
+    }
+    if exclude_news:
+        # Same file and mtime key the news filter itself uses
+        news_file = Path('news_calendar.csv')
+        settings['news_mtime'] = (
+            news_file.stat().st_mtime if news_file.exists() else None
+        )
+    return hashlib.blake2b(
+        json.dumps(settings, sort_keys=True, default=str).encode()
+    ).hexdigest()[:16]
+
+
+@lru_cache(maxsize=1)
+def _processing_code_hash() -> str:
+    """Hash of the cleaning code, so edits to it invalidate cached results."""
+    digest = hashlib.blake2b()
+    for module_path in (data_module.__file__, __file__):
+        digest.update(Path(module_path).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _current_month() -> pd.Timestamp:
+    """First instant of the current UTC calendar month."""
+    return month_start(pd.Timestamp.now(tz='UTC'))
+
+
+def _load_cached(path: Path) -> Optional[Tuple[pd.DataFrame, dict]]:
+    """
+    Load a cached (df_clean, metadata) pair.
+
+    Returns:
+        tuple or None: None if not cached or the cache cannot be read
+    """
+    meta_path = path.with_suffix('.json')
+    if not (path.exists() and meta_path.exists()):
+        return None
+
+    try:
+        df_clean = pd.read_parquet(path)
+        metadata = json.loads(meta_path.read_text())
+    except Exception as e:
+        logger.warning(f"Could not read cache {path.name}: {e}")
+        return None
+
+    # JSON stores timestamps as strings; restore them in the original timezone
+    for key in ('date_range_start', 'date_range_end'):
+        metadata[key] = pd.Timestamp(metadata[key]).tz_convert(metadata['timezone'])
+
+    logger.info(f"[OK] Loaded {len(df_clean)} candles from cache: {path.name}")
+    return df_clean, metadata
+
+
+def _save_cache(path: Path, df_clean: pd.DataFrame, metadata: dict) -> None:
+    """Store a (df_clean, metadata) pair; failures only log a warning."""
+    try:
+        df_clean.to_parquet(path, compression='zstd')
+        path.with_suffix('.json').write_text(json.dumps(metadata, default=str))
+        logger.info(f"Cached clean data: {path.name}")
+    except ImportError:
+        logger.warning("pyarrow not available, skipping result cache")
+    except Exception as e:
+        logger.warning(f"Could not write cache {path.name}: {e}")
+
+
 if __name__ == '__main__':
     logger.info("Data handler module imported successfully")
@@ -5,7 +5,7 @@ This module handles:
   - Timezone conversion (UTC <-> local)
   - Data validation (OHLC consistency)
   - Gap and outlier diagnostics
-  - Missing data imputation (MICE)
+  - Missing data imputation (interpolation or MICE)
   - News calendar filtering
 
 Raw data fetching is handled by database_connector.py.
@@ -13,50 +13,82 @@ Local CSV files can be loaded via load_from_csv().
 """
 
 import logging
+import os
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
+from zoneinfo import ZoneInfo
 
 import pandas as pd
 import numpy as np
-import pytz
 
 from shared.config import (
+    CACHE_DIR,
     INSTRUMENT_TIMEZONES,
     OUTLIER_THRESHOLD_MAD,
     OUTLIER_THRESHOLD_IQR,
+    OUTLIER_EXACT_MAX_ROWS,
+    OUTLIER_SAMPLE_SIZE,
     GAP_TOLERANCE_PERCENT,
     MICE_CONFIG,
+    IMPUTATION_INTERPOLATE_MAX_PCT,
     DIAGNOSTIC_SEED,
     DIAGNOSTIC_TEST_MISSING_PERCENT,
-    LOG_LEVEL,
-    LOGS_DIR,
     MARKET_HOLIDAYS,
+    MARKET_HOURS_SECONDS,
     PROJECT_ROOT,
     get_symbol_info,
+    is_crypto_symbol,
+    setup_logger,
 )
 
+# Optional: numba-compiled kernels (numpy fallback when not installed).
+# Compiled kernels are cached on disk so they are built once per machine.
+os.environ.setdefault('NUMBA_CACHE_DIR', str(CACHE_DIR / 'numba_cache'))
+try:
+    from numba import get_num_threads, njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+# Optional: MICE imputer (forward/back fill fallback when sklearn is missing).
+# Resolved once at import; sklearn's import chain is too slow to pay per call.
+try:
+    # Importing enable_iterative_imputer registers IterativeImputer
+    from sklearn.experimental import enable_iterative_imputer  # noqa: F401
+    from sklearn.impute import IterativeImputer as _IterativeImputerCls
+except ImportError:
+    _IterativeImputerCls = None
+
 # ============================================================================
 # LOGGING CONFIGURATION
 # ============================================================================
-logger = logging.getLogger(__name__)
-logger.setLevel(getattr(logging, LOG_LEVEL))
-
-# Console handler
-console_handler = logging.StreamHandler()
-console_handler.setLevel(getattr(logging, LOG_LEVEL))
-formatter = logging.Formatter(
-    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+logger = setup_logger(__name__, 'data_module.log')
+
+_NS_PER_SECOND = 1_000_000_000
+_NS_PER_DAY = 86_400 * _NS_PER_SECOND
+
+# Candle length in nanoseconds per timeframe (gap analysis)
+_TIMEFRAME_NS = {
+    'm1': 60 * _NS_PER_SECOND,
+    'm5': 300 * _NS_PER_SECOND,
+    'm15': 900 * _NS_PER_SECOND,
+    'h1': 3_600 * _NS_PER_SECOND,
+    'd1': _NS_PER_DAY,
+}
+
+# Holidays as int64 day numbers (days since epoch), packed into a bitset:
+# bit (day - _HOLIDAY_BASE_DAY) is set for every holiday
+_HOLIDAY_DAYS = (
+    pd.DatetimeIndex(sorted(MARKET_HOLIDAYS)).as_unit('ns').asi8 // _NS_PER_DAY
 )
-console_handler.setFormatter(formatter)
-logger.addHandler(console_handler)
-
-# File handler
-log_file = LOGS_DIR / 'data_module.log'
-file_handler = logging.FileHandler(log_file)
-file_handler.setLevel(getattr(logging, LOG_LEVEL))
-file_handler.setFormatter(formatter)
-logger.addHandler(file_handler)
+_HOLIDAY_BASE_DAY = int(_HOLIDAY_DAYS.min())
+_HOLIDAY_BITS = np.zeros(
+    (int(_HOLIDAY_DAYS.max()) - _HOLIDAY_BASE_DAY) // 64 + 1, dtype=np.uint64
+)
+for _offset in _HOLIDAY_DAYS - _HOLIDAY_BASE_DAY:
+    _HOLIDAY_BITS[_offset >> 6] |= np.uint64(1) << np.uint64(_offset & 63)
 
 
 # ============================================================================
@@ -103,26 +135,34 @@ def process_data(
     if 'timestamp' in df.columns:
         df = df.set_index('timestamp')
 
+    # Downstream filtering slices by time, which needs a sorted index
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index()
+
     # Step 2: Localize to UTC if naive (needed for proper timezone handling)
     if df.index.tz is None:
-        df.index = df.index.tz_localize('UTC')
+        df.index = df.index.tz_localize(_zoneinfo('UTC'))
 
     # Step 3: Convert to local timezone for analysis (market hours are in local time)
+    # Skipped when the index is already in the target zone (e.g. UTC crypto)
     target_tz = get_symbol_info(symbol)['timezone']
-    df = _convert_to_local_time(df, target_tz)
-    logger.info(f"Converted to local timezone: {target_tz}")
+    if str(df.index.tz) != target_tz:
+        df = _convert_to_local_time(df, target_tz)
+        logger.info(f"Converted to local timezone: {target_tz}")
 
-    # Step 4: Filter to market hours only
-    df = _filter_to_market_hours(df, symbol)
+    # Step 4: Filter to market hours only (24/7 crypto markets keep all data)
+    if not is_crypto_symbol(symbol):
+        df = _filter_to_market_hours(df, symbol)
 
-    # Step 5: Validate OHLC consistency
-    _validate_ohlc(df, symbol)
+    # Step 5: Validate OHLC consistency (also yields per-column NaN counts,
+    # reused by cleaning instead of rescanning the frame)
+    nan_counts = _validate_ohlc(df, symbol)
 
     # Step 6: Diagnostics (gaps, outliers, missing data) - now in local time, market hours only
     _run_diagnostics(df, symbol, timeframe)
 
     # Step 7: Data cleaning (imputation)
-    df = _clean_data(df, symbol)
+    df = _clean_data(df, symbol, nan_counts)
 
     # Step 8: News filtering (if requested)
     if exclude_news:
@@ -179,7 +219,20 @@ def load_from_csv(
 
     logger.info(f"Loading data from CSV: {filepath.name}")
 
-    df = pd.read_csv(filepath)
+    # pyarrow's multithreaded parser reads columns straight into float64/int64
+    # blocks; the default C parser is used when pyarrow is not installed or
+    # rejects the file (ArrowInvalid/ParserError are ValueErrors, e.g. for
+    # ragged rows the C parser pads with NaN)
+    try:
+        df = pd.read_csv(filepath, engine='pyarrow')
+    except ImportError:
+        df = pd.read_csv(filepath)
+    except ValueError as e:
+        logger.warning(
+            f"pyarrow could not parse {filepath.name} ({e}), "
+            f"retrying with the default parser"
+        )
+        df = pd.read_csv(filepath)
 
     # Auto-detect timestamp column
     if timestamp_col is None:
@@ -196,14 +249,17 @@ def load_from_csv(
 
     logger.info(f"Using timestamp column: '{timestamp_col}'")
 
-    # Parse timestamps - utc=True handles mixed offsets (CET/CEST etc.)
-    df[timestamp_col] = pd.to_datetime(df[timestamp_col], utc=True)
+    # Parse timestamps - utc=True handles mixed offsets (CET/CEST etc.).
+    # pyarrow hands date-only columns over as date32 (datetime.date objects)
+    # and offset timestamps at second resolution; both engines end on the
+    # same microsecond index
+    df[timestamp_col] = pd.to_datetime(df[timestamp_col], utc=True).dt.as_unit('us')
     df = df.set_index(timestamp_col)
     df.index.name = None
 
     # Convert to target timezone if specified
     if timezone:
-        df.index = df.index.tz_convert(timezone)
+        df.index = df.index.tz_convert(_zoneinfo(timezone))
         logger.info(f"Converted to timezone: {timezone}")
 
     # Standardize column names to lowercase
@@ -243,27 +299,18 @@ def _filter_to_market_hours(df: pd.DataFrame, symbol: str) -> pd.DataFrame:
         Filtered DataFrame with only market-hours candles.
     """
     try:
-        symbol_info = get_symbol_info(symbol)
-        market_open = symbol_info['market_open']
-        market_close = symbol_info['market_close']
-    except:
+        open_sec, close_sec = MARKET_HOURS_SECONDS[symbol.lower()]
+    except KeyError:
         # If symbol not found, return data as-is (24/7 markets like crypto)
         logger.info("Market hours not found for symbol, keeping all data")
         return df
 
-    # Filter by weekday (0=Mon, 4=Fri, 5=Sat, 6=Sun)
-    df_filtered = df[df.index.weekday < 5].copy()
-
-    # Filter by holiday
-    df_filtered = df_filtered[
-        ~df_filtered.index.strftime('%Y-%m-%d').isin(MARKET_HOLIDAYS)
-    ].copy()
-
-    # Filter by market hours
-    df_filtered = df_filtered[
-        (df_filtered.index.time >= market_open) &
-        (df_filtered.index.time <= market_close)
-    ].copy()
+    # Sorted data (the normal case): slice each trading day's session directly.
+    # Otherwise fall back to a full boolean mask.
+    if len(df) and df.index.is_monotonic_increasing:
+        df_filtered = df.iloc[_market_hours_positions(df.index, open_sec, close_sec)]
+    else:
+        df_filtered = df.loc[_market_hours_mask(df.index, open_sec, close_sec)]
 
     n_removed = len(df) - len(df_filtered)
     logger.info(
@@ -274,6 +321,94 @@ def _filter_to_market_hours(df: pd.DataFrame, symbol: str) -> pd.DataFrame:
     return df_filtered
 
 
+def _market_hours_mask(
+    index: pd.DatetimeIndex,
+    open_sec: int,
+    close_sec: int,
+) -> np.ndarray:
+    """
+    Boolean mask of rows on trading days (weekday, non-holiday) within market hours.
+
+    Everything is derived from one int64 view of the local wall-clock times
+    (no datetime.time objects or repeated index attribute lookups).
+    """
+    local_ns = index.tz_localize(None).as_unit('ns').asi8
+    local_days = local_ns // _NS_PER_DAY  # days since epoch
+    sec_of_day = (local_ns - local_days * _NS_PER_DAY) // _NS_PER_SECOND
+    weekday = (local_days + 3) % 7  # 1970-01-01 was a Thursday
+
+    return (
+        (weekday < 5)
+        & ~_is_holiday(local_days)
+        & (sec_of_day >= open_sec)
+        & (sec_of_day <= close_sec)
+    )
+
+
+def _market_hours_positions(
+    index: pd.DatetimeIndex,
+    open_sec: int,
+    close_sec: int,
+) -> np.ndarray:
+    """
+    Row positions within market hours, for a sorted index.
+
+    Same selection as _market_hours_mask, but only the session boundaries of
+    each trading day are computed (localized to the index timezone, so DST is
+    handled) and located with searchsorted; rows are then taken as contiguous
+    runs instead of testing every row.
+    """
+    first_day = index[0].tz_localize(None).normalize().value // _NS_PER_DAY
+    last_day = index[-1].tz_localize(None).normalize().value // _NS_PER_DAY
+    days = np.arange(first_day, last_day + 1, dtype=np.int64)
+    days = days[((days + 3) % 7 < 5) & ~_is_holiday(days)]
+
+    # Session bounds as local wall-clock times; the close bound is exclusive
+    # at close + 1s, matching the inclusive per-second check in the mask
+    day_ns = days * _NS_PER_DAY
+    opens = pd.DatetimeIndex(day_ns + open_sec * _NS_PER_SECOND)
+    closes = pd.DatetimeIndex(day_ns + (close_sec + 1) * _NS_PER_SECOND)
+    if index.tz is not None:
+        # Ambiguous (DST fall-back) opens take the earlier instant and closes
+        # the later one; nonexistent times shift into the valid range
+        opens = opens.tz_localize(
+            index.tz, ambiguous=np.ones(len(opens), dtype=bool),
+            nonexistent='shift_forward',
+        )
+        closes = closes.tz_localize(
+            index.tz, ambiguous=np.zeros(len(closes), dtype=bool),
+            nonexistent='shift_backward',
+        )
+
+    index_ns = index.as_unit('ns').asi8
+    starts = np.searchsorted(index_ns, opens.as_unit('ns').asi8, side='left')
+    ends = np.searchsorted(index_ns, closes.as_unit('ns').asi8, side='left')
+    lengths = np.maximum(ends - starts, 0)
+
+    # Concatenate the [start, end) runs into one position array
+    offsets = np.cumsum(lengths) - lengths
+    return np.arange(lengths.sum()) + np.repeat(starts - offsets, lengths)
+
+
+def _is_holiday(days: np.ndarray) -> np.ndarray:
+    """
+    Vectorized holiday lookup against the packed holiday bitset.
+
+    Args:
+        days (np.ndarray): int64 day numbers (days since epoch)
+
+    Returns:
+        np.ndarray: Boolean mask, True where the day is in MARKET_HOLIDAYS
+    """
+    offsets = days - _HOLIDAY_BASE_DAY
+    in_range = (offsets >= 0) & (offsets < len(_HOLIDAY_BITS) * 64)
+    offsets = np.where(in_range, offsets, 0).astype(np.uint64)
+
+    words = _HOLIDAY_BITS[offsets >> np.uint64(6)]
+    bits = (words >> (offsets & np.uint64(63))) & np.uint64(1)
+    return in_range & bits.astype(bool)
+
+
 # ============================================================================
 # TIMEZONE HANDLING
 # ============================================================================
@@ -283,7 +418,7 @@ def _convert_to_local_time(df: pd.DataFrame, target_tz: str) -> pd.DataFrame:
 
     Args:
         df (pd.DataFrame): DataFrame with UTC timezone-aware index
-        target_tz (str): Target timezone (pytz format)
+        target_tz (str): Target timezone (IANA name, e.g. "Europe/Berlin")
 
     Returns:
         pd.DataFrame: DataFrame with local timezone index
@@ -292,7 +427,7 @@ def _convert_to_local_time(df: pd.DataFrame, target_tz: str) -> pd.DataFrame:
         raise ValueError("DataFrame index must be timezone-aware (UTC)")
 
     try:
-        df.index = df.index.tz_convert(target_tz)
+        df.index = df.index.tz_convert(_zoneinfo(target_tz))
         logger.debug(f"Timezone converted to {target_tz}")
         return df
     except Exception as e:
@@ -300,10 +435,79 @@ def _convert_to_local_time(df: pd.DataFrame, target_tz: str) -> pd.DataFrame:
         raise
 
 
+@lru_cache(maxsize=None)
+def _zoneinfo(tz_name: str) -> ZoneInfo:
+    """Return a shared stdlib ZoneInfo for an IANA timezone name."""
+    return ZoneInfo(tz_name)
+
+
 # ============================================================================
 # DATA VALIDATION
 # ============================================================================
-def _validate_ohlc(df: pd.DataFrame, symbol: str) -> None:
+# _ohlc_violation_counts(values) takes an (N, 5) OHLCV float array and returns
+# 12 int64 counts:
+#   [0] high < low
+#   [1] high < open or high < close
+#   [2] low > open or low > close
+#   [3:7] open/high/low/close <= 0
+#   [7:12] NaN in open/high/low/close/volume
+# Comparisons involving NaN count as valid (same as pandas/numpy semantics).
+def _ohlc_violation_counts_numpy(values: np.ndarray) -> np.ndarray:
+    """Numpy implementation of _ohlc_violation_counts."""
+    o, h, l, c = values[:, 0], values[:, 1], values[:, 2], values[:, 3]
+    counts = np.zeros(12, dtype=np.int64)
+    counts[7:12] = np.count_nonzero(np.isnan(values), axis=0)
+
+    # Comparisons with NaN are False, so rows with missing values are never
+    # counted as violations; they are reported through the NaN counts only
+    high_low = h < l
+    high_oc = (h < o) | (h < c)
+    low_oc = (l > o) | (l > c)
+    nonpositive = values[:, :4] <= 0
+
+    # Per-check counts only when something is actually invalid
+    if high_low.any() or high_oc.any() or low_oc.any() or nonpositive.any():
+        counts[0] = np.count_nonzero(high_low)
+        counts[1] = np.count_nonzero(high_oc)
+        counts[2] = np.count_nonzero(low_oc)
+        counts[3:7] = np.count_nonzero(nonpositive, axis=0)
+    return counts
+
+
+if _HAS_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _ohlc_violation_counts(values):
+        """Single-sweep numba implementation; rows are split into chunks."""
+        n = values.shape[0]
+        n_chunks = 64
+        chunk = (n + n_chunks - 1) // n_chunks
+        partial = np.zeros((n_chunks, 12), dtype=np.int64)
+
+        for k in prange(n_chunks):
+            for i in range(k * chunk, min(n, (k + 1) * chunk)):
+                o = values[i, 0]
+                h = values[i, 1]
+                l = values[i, 2]
+                c = values[i, 3]
+                if h < l:
+                    partial[k, 0] += 1
+                if h < o or h < c:
+                    partial[k, 1] += 1
+                if l > o or l > c:
+                    partial[k, 2] += 1
+                for j in range(4):
+                    if values[i, j] <= 0:
+                        partial[k, 3 + j] += 1
+                for j in range(5):
+                    if np.isnan(values[i, j]):
+                        partial[k, 7 + j] += 1
+
+        return partial.sum(axis=0)
+else:
+    _ohlc_violation_counts = _ohlc_violation_counts_numpy
+
+
+def _validate_ohlc(df: pd.DataFrame, symbol: str) -> np.ndarray:
     """
     Validate OHLC consistency.
 
@@ -317,6 +521,9 @@ def _validate_ohlc(df: pd.DataFrame, symbol: str) -> None:
     Args:
         df (pd.DataFrame): DataFrame with OHLCV columns
 
+    Returns:
+        np.ndarray: NaN count per column (open, high, low, close, volume)
+
     Raises:
         ValueError: If validation fails critically
     """
@@ -325,41 +532,41 @@ def _validate_ohlc(df: pd.DataFrame, symbol: str) -> None:
     if missing_cols:
         raise ValueError(f"Missing columns: {missing_cols}")
 
+    # Read OHLCV once as a (N, 5) float array; one pass counts all violations
+    values = df[required_cols].to_numpy(dtype=np.float64, copy=False)
+    counts = _ohlc_violation_counts(values)
+
     # Check for NaN (before imputation)
-    nan_counts = df[required_cols].isna().sum()
+    nan_counts = counts[7:12]
     if nan_counts.any():
+        nan_series = pd.Series(nan_counts, index=required_cols)
         logger.warning(
-            f"NaN values found in {symbol}:\n{nan_counts[nan_counts > 0]}"
+            f"NaN values found in {symbol}:\n{nan_series[nan_series > 0]}"
         )
 
     # High >= Low
-    invalid_hl = df['high'] < df['low']
-    if invalid_hl.any():
-        n_invalid = invalid_hl.sum()
+    n_invalid = counts[0]
+    if n_invalid:
         logger.warning(f"{n_invalid} candles with High < Low")
 
     # High >= Open, Close
-    invalid_ho = df['high'] < df['open']
-    invalid_hc = df['high'] < df['close']
-    if (invalid_ho | invalid_hc).any():
-        n_invalid = (invalid_ho | invalid_hc).sum()
+    n_invalid = counts[1]
+    if n_invalid:
         logger.warning(f"{n_invalid} candles with High < Open or Close")
 
     # Low <= Open, Close
-    invalid_lo = df['low'] > df['open']
-    invalid_lc = df['low'] > df['close']
-    if (invalid_lo | invalid_lc).any():
-        n_invalid = (invalid_lo | invalid_lc).sum()
+    n_invalid = counts[2]
+    if n_invalid:
         logger.warning(f"{n_invalid} candles with Low > Open or Close")
 
     # Price columns should be positive
     price_cols = ['open', 'high', 'low', 'close']
-    for col in price_cols:
-        if (df[col] <= 0).any():
-            n_invalid = (df[col] <= 0).sum()
+    for col, n_invalid in zip(price_cols, counts[3:7]):
+        if n_invalid:
             logger.warning(f"{n_invalid} candles with {col} <= 0")
 
     logger.info("[OK] OHLC validation complete")
+    return nan_counts
 
 
 # ============================================================================
@@ -386,8 +593,11 @@ def _run_diagnostics(
     logger.info(f"Running diagnostics for {symbol} {timeframe}...")
 
     _analyze_gaps(df, timeframe, symbol)
-    _analyze_missing_data(df)
-    _detect_outliers(df)
+
+    # Missing-data and outlier counts come from one shared sweep
+    cols, n_rows, nan_counts, outlier_counts = _diagnostics_summary(df)
+    _log_missing_data(cols, n_rows, nan_counts)
+    _log_outliers(cols, outlier_counts)
 
     logger.info("[OK] Diagnostics complete")
 
@@ -410,22 +620,15 @@ def _analyze_gaps(df: pd.DataFrame, timeframe: str, symbol: str = None) -> None:
         logger.warning("Not enough data to analyze gaps")
         return
 
-    freq_map = {
-        'm1': 1,
-        'm5': 5,
-        'm15': 15,
-        'h1': 60,
-        'd1': 1440,
-    }
-
-    expected_minutes = freq_map.get(timeframe.lower())
-    if expected_minutes is None:
+    candle_ns = _TIMEFRAME_NS.get(timeframe.lower())
+    if candle_ns is None:
         logger.warning(f"Unknown timeframe {timeframe}, skipping gap analysis")
         return
 
-    # Calculate expected duration based on first and last timestamp
-    total_duration = (df.index[-1] - df.index[0]).total_seconds() / 60  # in minutes
-    expected_candles_theoretical = (total_duration / expected_minutes) + 1
+    # Calculate expected candles based on first and last timestamp
+    # (int64 nanoseconds; no Timedelta/Series materialized)
+    ns = df.index.as_unit('ns').asi8
+    expected_candles_theoretical = float(ns[-1] - ns[0]) / candle_ns + 1
 
     # Actual candles we have
     actual_candles = len(df)
@@ -434,12 +637,14 @@ def _analyze_gaps(df: pd.DataFrame, timeframe: str, symbol: str = None) -> None:
     missing_candles = expected_candles_theoretical - actual_candles
     gap_pct = (missing_candles / expected_candles_theoretical * 100) if expected_candles_theoretical > 0 else 0
 
-    logger.info(f"Gap Analysis ({symbol or 'data'} {timeframe}):")
-    logger.info(f"  Date range (local): {df.index.min()} to {df.index.max()}")
-    logger.info(f"  Theoretical candles (continuous): {expected_candles_theoretical:.0f}")
-    logger.info(f"  Actual candles: {actual_candles}")
-    logger.info(f"  Missing: {missing_candles:.0f} ({gap_pct:.1f}%)")
-    logger.info(f"  Note: Data already filtered to market hours (weekdays, trading hours, non-holidays)")
+    # Timestamp formatting is only paid for when INFO is actually emitted
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"Gap Analysis ({symbol or 'data'} {timeframe}):")
+        logger.info(f"  Date range (local): {df.index.min()} to {df.index.max()}")
+        logger.info(f"  Theoretical candles (continuous): {expected_candles_theoretical:.0f}")
+        logger.info(f"  Actual candles: {actual_candles}")
+        logger.info(f"  Missing: {missing_candles:.0f} ({gap_pct:.1f}%)")
+        logger.info(f"  Note: Data already filtered to market hours (weekdays, trading hours, non-holidays)")
 
     if gap_pct > 5:
         logger.warning(f"  [WARNING] Gap rate {gap_pct:.1f}% exceeds 5% threshold")
@@ -449,79 +654,234 @@ def _analyze_gaps(df: pd.DataFrame, timeframe: str, symbol: str = None) -> None:
 
 def _analyze_missing_data(df: pd.DataFrame) -> None:
     """Analyze missing data (NaN) in OHLCV columns."""
+    cols, values = _ohlcv_values(df)
+    _log_missing_data(
+        cols, len(values), np.count_nonzero(np.isnan(values), axis=0)
+    )
+
+
+def _detect_outliers(df: pd.DataFrame) -> None:
+    """Detect outliers using MAD and IQR methods."""
+    cols, _, _, outlier_counts = _diagnostics_summary(df)
+    _log_outliers(cols, outlier_counts)
+
+
+def _ohlcv_values(df: pd.DataFrame) -> Tuple[List[str], np.ndarray]:
+    """Return the OHLCV columns present in df and their (N, k) float array."""
     ohlcv_cols = ['open', 'high', 'low', 'close', 'volume']
     existing_cols = [c for c in ohlcv_cols if c in df.columns]
+    return existing_cols, df[existing_cols].to_numpy(dtype=float)
 
-    missing_pct = (df[existing_cols].isna().sum() / len(df)) * 100
 
-    if (missing_pct > 0).any():
-        logger.warning("Missing data detected:")
-        for col in existing_cols:
-            if missing_pct[col] > 0:
-                pct = missing_pct[col]
-                logger.warning(f"  {col}: {pct:.2f}% missing")
+def _diagnostics_summary(
+    df: pd.DataFrame,
+) -> Tuple[List[str], int, np.ndarray, np.ndarray]:
+    """
+    Compute per-column NaN and outlier counts for OHLCV columns.
 
-                if pct > GAP_TOLERANCE_PERCENT:
-                    logger.warning(
-                        f"  [WARNING] {col} exceeds {GAP_TOLERANCE_PERCENT}% threshold"
-                    )
-    else:
-        logger.info("[OK] No missing data")
+    Outlier bounds need medians/quantiles (a selection pass, on a random
+    sample for long series); the final NaN and outlier counting is fused
+    into a single sweep over the full array.
 
+    Returns:
+        tuple: (columns, n_rows, nan_counts, outlier_counts)
+    """
+    cols, values = _ohlcv_values(df)
+    lower, upper = _outlier_bounds(
+        _quantile_sample(values), OUTLIER_THRESHOLD_MAD, OUTLIER_THRESHOLD_IQR
+    )
+    counts = _diagnostics_sweep(values, lower, upper)
+    return cols, len(values), counts[0], counts[1]
 
-def _detect_outliers(df: pd.DataFrame) -> None:
-    """Detect outliers using MAD and IQR methods."""
-    ohlcv_cols = ['open', 'high', 'low', 'close', 'volume']
-    existing_cols = [c for c in ohlcv_cols if c in df.columns]
 
-    outliers_found = False
+def _quantile_sample(values: np.ndarray) -> np.ndarray:
+    """
+    Rows used to estimate outlier bounds.
 
-    for col in existing_cols:
-        data = df[col].dropna()
-        if len(data) < 3:
-            continue
+    Returns values unchanged up to OUTLIER_EXACT_MAX_ROWS rows; longer series
+    are subsampled (seeded, so diagnostics are reproducible). The bounds are
+    diagnostic thresholds and don't need exact quantiles.
+    """
+    n = len(values)
+    if n <= OUTLIER_EXACT_MAX_ROWS:
+        return values
+    rng = np.random.default_rng(DIAGNOSTIC_SEED)
+    rows = np.sort(rng.integers(0, n, size=OUTLIER_SAMPLE_SIZE))
+    return values[rows]
+
+
+# _outlier_bounds(values, mad_threshold, iqr_threshold) returns combined
+# MAD/IQR outlier bounds per column as (lower, upper) float arrays, NaN ignored.
+# A value is an outlier if it falls outside either the MAD band
+# (median ± mad_threshold * MAD) or the IQR band
+# (Q1 - iqr_threshold * IQR, Q3 + iqr_threshold * IQR), i.e. below the larger
+# lower bound or above the smaller upper bound.
+# Columns with fewer than 3 non-NaN values get NaN bounds (never flagged).
+def _outlier_bounds_numpy(
+    values: np.ndarray,
+    mad_threshold: float,
+    iqr_threshold: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Numpy implementation of _outlier_bounds."""
+    n_cols = values.shape[1]
+    lower = np.full(n_cols, np.nan)
+    upper = np.full(n_cols, np.nan)
+
+    valid = np.count_nonzero(~np.isnan(values), axis=0) >= 3
+    if not valid.any():
+        return lower, upper
+    data = values[:, valid] if not valid.all() else values
+
+    # Q1/median/Q3 for all columns in one call, then MAD
+    q1, median, q3 = np.nanpercentile(data, [25, 50, 75], axis=0)
+    mad = np.nanmedian(np.abs(data - median), axis=0)
+    iqr = q3 - q1
+
+    lower[valid] = np.maximum(median - mad_threshold * mad, q1 - iqr_threshold * iqr)
+    upper[valid] = np.minimum(median + mad_threshold * mad, q3 + iqr_threshold * iqr)
+
+    return lower, upper
+
+
+if _HAS_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _outlier_bounds_numba(values, mad_threshold, iqr_threshold):
+        """Numba implementation of _outlier_bounds; columns run in parallel."""
+        k = values.shape[1]
+        lower = np.full(k, np.nan)
+        upper = np.full(k, np.nan)
+
+        for j in prange(k):
+            column = values[:, j]
+            data = column[~np.isnan(column)]
+            if data.shape[0] < 3:
+                continue
+
+            q1 = np.percentile(data, 25.0)
+            median = np.median(data)
+            q3 = np.percentile(data, 75.0)
+            mad = np.median(np.abs(data - median))
+            iqr = q3 - q1
+
+            lower[j] = max(median - mad_threshold * mad, q1 - iqr_threshold * iqr)
+            upper[j] = min(median + mad_threshold * mad, q3 + iqr_threshold * iqr)
+
+        return lower, upper
+
+    def _outlier_bounds(
+        values: np.ndarray,
+        mad_threshold: float,
+        iqr_threshold: float,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Use the numba kernel only when it can run columns on several threads;
+        single-threaded, numpy's partition-based quantiles are faster.
+        """
+        if get_num_threads() > 1:
+            return _outlier_bounds_numba(values, mad_threshold, iqr_threshold)
+        return _outlier_bounds_numpy(values, mad_threshold, iqr_threshold)
+else:
+    _outlier_bounds = _outlier_bounds_numpy
+
+
+# _diagnostics_sweep(values, lower, upper) returns a (2, k) int64 array:
+#   [0] NaN count per column
+#   [1] outlier count per column (value < lower or value > upper)
+def _diagnostics_sweep_numpy(
+    values: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+) -> np.ndarray:
+    """Numpy implementation of _diagnostics_sweep."""
+    counts = np.empty((2, values.shape[1]), dtype=np.int64)
+    counts[0] = np.count_nonzero(np.isnan(values), axis=0)
+    counts[1] = np.count_nonzero((values < lower) | (values > upper), axis=0)
+    return counts
+
+
+if _HAS_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _diagnostics_sweep(values, lower, upper):
+        """Single-sweep numba implementation; one column per thread."""
+        n, k = values.shape
+        counts = np.zeros((2, k), dtype=np.int64)
+
+        for j in prange(k):
+            n_nan = 0
+            n_out = 0
+            lo = lower[j]
+            hi = upper[j]
+            for i in range(n):
+                x = values[i, j]
+                if np.isnan(x):
+                    n_nan += 1
+                elif x < lo or x > hi:
+                    n_out += 1
+            counts[0, j] = n_nan
+            counts[1, j] = n_out
+
+        return counts
+else:
+    _diagnostics_sweep = _diagnostics_sweep_numpy
+
+
+def _log_missing_data(
+    cols: List[str],
+    n_rows: int,
+    nan_counts: np.ndarray,
+) -> None:
+    """Log per-column missing-data percentages."""
+    if n_rows == 0 or not nan_counts.any():
+        logger.info("[OK] No missing data")
+        return
 
-        # MAD method
-        median = data.median()
-        mad = (data - median).abs().median()
-        mad_outliers = (
-            (data < median - OUTLIER_THRESHOLD_MAD * mad) |
-            (data > median + OUTLIER_THRESHOLD_MAD * mad)
-        )
+    logger.warning("Missing data detected:")
+    for col, n_missing in zip(cols, nan_counts.tolist()):
+        if n_missing > 0:
+            pct = n_missing / n_rows * 100
+            logger.warning(f"  {col}: {pct:.2f}% missing")
 
-        # IQR method
-        q1 = data.quantile(0.25)
-        q3 = data.quantile(0.75)
-        iqr = q3 - q1
-        iqr_outliers = (
-            (data < q1 - OUTLIER_THRESHOLD_IQR * iqr) |
-            (data > q3 + OUTLIER_THRESHOLD_IQR * iqr)
-        )
+            if pct > GAP_TOLERANCE_PERCENT:
+                logger.warning(
+                    f"  [WARNING] {col} exceeds {GAP_TOLERANCE_PERCENT}% threshold"
+                )
 
-        n_outliers = (mad_outliers | iqr_outliers).sum()
-        if n_outliers > 0:
-            logger.warning(f"Detected {n_outliers} outliers in {col}")
-            outliers_found = True
 
-    if not outliers_found:
+def _log_outliers(cols: List[str], outlier_counts: np.ndarray) -> None:
+    """Log per-column outlier counts."""
+    if not outlier_counts.any():
         logger.info("[OK] No outliers detected")
+        return
+
+    for col, n_outliers in zip(cols, outlier_counts.tolist()):
+        if n_outliers:
+            logger.warning(f"Detected {n_outliers} outliers in {col}")
 
 
 # ============================================================================
 # DATA CLEANING
 # ============================================================================
-def _clean_data(df: pd.DataFrame, symbol: str) -> pd.DataFrame:
+def _clean_data(
+    df: pd.DataFrame,
+    symbol: str,
+    nan_counts: Optional[np.ndarray] = None,
+) -> pd.DataFrame:
     """
-    Clean and impute missing data using MICE.
+    Clean and impute missing data.
+
+    Sparse gaps (below IMPUTATION_INTERPOLATE_MAX_PCT of cells) are filled
+    by time-weighted linear interpolation; denser gaps use MICE.
 
     Steps:
-      1. Standardize numeric columns
-      2. MICE imputation
-      3. Reverse standardization
-      4. Enforce OHLC consistency
+      1. Impute missing values (interpolation or MICE)
+      2. Enforce OHLC consistency
 
     Args:
         df (pd.DataFrame): OHLCV DataFrame with potential missing values
+        symbol (str): Symbol name
+        nan_counts (np.ndarray): Precomputed NaN count per OHLCV column
+                                 (as returned by _validate_ohlc); counted
+                                 here when omitted
 
     Returns:
         pd.DataFrame: Cleaned DataFrame
@@ -532,52 +892,29 @@ def _clean_data(df: pd.DataFrame, symbol: str) -> pd.DataFrame:
     existing_cols = [c for c in ohlcv_cols if c in df.columns]
 
     # Check if imputation is needed
-    if df[existing_cols].isna().sum().sum() == 0:
+    if nan_counts is not None and len(nan_counts) == len(existing_cols):
+        nan_per_col = np.asarray(nan_counts)
+    else:
+        nan_per_col = df[existing_cols].isna().sum().to_numpy()
+    total_nan = int(nan_per_col.sum())
+    if total_nan == 0:
         logger.info("No missing data - skipping imputation")
         return df
+    nan_pct = total_nan / (len(df) * len(existing_cols)) * 100
 
-    # Step 1: Standardize
-    from sklearn.preprocessing import StandardScaler
-    scaler = StandardScaler()
-    df_standardized = df[existing_cols].copy()
-    df_standardized[existing_cols] = scaler.fit_transform(
-        df[existing_cols]
-    )
-
-    # Step 2: MICE Imputation
-    try:
-        from sklearn.experimental import enable_iterative_imputer
-        from sklearn.impute import IterativeImputer
-
-        enable_iterative_imputer()
-
-        imputer = IterativeImputer(
-            max_iter=MICE_CONFIG['max_iter'],
-            random_state=MICE_CONFIG['random_state'],
-            verbose=MICE_CONFIG['verbose'],
+    # Step 1: Impute
+    if nan_pct < IMPUTATION_INTERPOLATE_MAX_PCT:
+        df_imputed = df[existing_cols].interpolate(
+            method='time', limit_direction='both'
         )
-
-        df_imputed_std = pd.DataFrame(
-            imputer.fit_transform(df_standardized),
-            index=df_standardized.index,
-            columns=df_standardized.columns,
-        )
-
         logger.info(
-            f"MICE imputation complete (max_iter={MICE_CONFIG['max_iter']})"
+            f"Interpolation complete ({total_nan} missing values, "
+            f"{nan_pct:.3f}% of cells)"
         )
+    else:
+        df_imputed = _impute_mice(df[existing_cols], nan_per_col)
 
-    except ImportError:
-        logger.warning("sklearn.impute not available, using forward fill")
-        df_imputed_std = df_standardized.fillna(method='ffill').fillna(
-            method='bfill'
-        )
-
-    # Step 3: Reverse standardization
-    df_imputed = df[existing_cols].copy()
-    df_imputed[existing_cols] = scaler.inverse_transform(df_imputed_std)
-
-    # Step 4: Ensure consistency
+    # Step 2: Ensure consistency
     df_imputed = _enforce_ohlc_consistency(df_imputed)
 
     # Preserve non-OHLCV columns
@@ -589,25 +926,107 @@ def _clean_data(df: pd.DataFrame, symbol: str) -> pd.DataFrame:
     return df_imputed
 
 
+def _impute_mice(
+    df: pd.DataFrame,
+    nan_per_col: np.ndarray,
+) -> pd.DataFrame:
+    """
+    Impute missing values using MICE on standardized columns.
+
+    Steps:
+      1. Standardize numeric columns
+      2. MICE imputation
+      3. Reverse standardization
+
+    Entirely empty columns have nothing to learn from: they are left NaN
+    (with a warning) and the other columns are imputed without them.
+
+    Args:
+        df (pd.DataFrame): Numeric OHLCV columns with missing values
+        nan_per_col (np.ndarray): Missing values per column
+
+    Returns:
+        pd.DataFrame: Imputed columns (same index/columns as df)
+    """
+    values = df.to_numpy(dtype=np.float64, copy=True)
+
+    empty = nan_per_col == len(df)
+    if empty.any():
+        logger.warning(
+            f"Columns with no data left unimputed: {list(df.columns[empty])}"
+        )
+        if empty.all():
+            return df.copy()
+    keep = ~empty
+
+    # Step 1: Standardize (in place on a single float64 buffer; NaN ignored
+    # in the statistics, zero-variance columns scaled by 1 like StandardScaler)
+    fit = values[:, keep] if empty.any() else values
+    mean = np.nanmean(fit, axis=0)
+    std = np.nanstd(fit, axis=0)
+    std[std == 0] = 1.0
+    fit -= mean
+    fit /= std
+
+    # Step 2: MICE Imputation
+    # Complete columns are predictors only (skip_complete), never imputation
+    # targets; sparse gaps never get here (interpolated in _clean_data)
+    max_iter = MICE_CONFIG['max_iter']
+
+    if _IterativeImputerCls is None:
+        logger.warning("sklearn.impute not available, using forward fill")
+        # copy=True: the filled frame's array is read-only under copy-on-write
+        fit = pd.DataFrame(fit, copy=False).ffill().bfill().to_numpy(copy=True)
+    else:
+        imputer = _IterativeImputerCls(
+            max_iter=max_iter,
+            random_state=MICE_CONFIG['random_state'],
+            verbose=MICE_CONFIG['verbose'],
+            tol=MICE_CONFIG['tol'],
+            skip_complete=MICE_CONFIG['skip_complete'],
+        )
+        fit = imputer.fit_transform(fit)
+
+        logger.info(
+            f"MICE imputation complete (max_iter={max_iter}, "
+            f"{int(nan_per_col[keep].sum())} missing values in "
+            f"{int((nan_per_col[keep] > 0).sum())}/{int(keep.sum())} columns)"
+        )
+
+    # Step 3: Reverse standardization (in place)
+    fit *= std
+    fit += mean
+    if empty.any():
+        values[:, keep] = fit
+    else:
+        values = fit
+
+    # The buffer is owned here; wrap it instead of copying into a new block
+    return pd.DataFrame(values, index=df.index, columns=df.columns, copy=False)
+
+
 def _enforce_ohlc_consistency(df: pd.DataFrame) -> pd.DataFrame:
     """
     Enforce OHLC consistency post-imputation.
 
+    Modifies df in place (callers pass a freshly imputed frame).
+
     Rules:
       - High = max(Open, Close, High)
       - Low = min(Open, Close, Low)
     """
-    df = df.copy()
+    o = df['open'].to_numpy()
+    c = df['close'].to_numpy()
 
-    # Ensure High >= all prices
-    df['high'] = df[['high', 'open', 'close']].max(axis=1)
+    # Ensure High >= all prices (fmax/fmin skip NaN like DataFrame.max)
+    df['high'] = np.fmax(df['high'].to_numpy(), np.fmax(o, c))
 
     # Ensure Low <= all prices
-    df['low'] = df[['low', 'open', 'close']].min(axis=1)
+    df['low'] = np.fmin(df['low'].to_numpy(), np.fmin(o, c))
 
     # Ensure volume >= 0
     if 'volume' in df.columns:
-        df['volume'] = df['volume'].clip(lower=0)
+        df['volume'] = np.clip(df['volume'].to_numpy(), 0, None)
 
     return df
 
@@ -639,12 +1058,12 @@ def _filter_news_dates(
         return df
 
     try:
-        news_df = pd.read_csv(news_file)
-        news_df['date'] = pd.to_datetime(news_df['date'])
-        news_dates = set(news_df['date'].dt.date)
+        # Keyed on mtime so edits to the calendar invalidate the cached parse
+        news_days = _load_news_days(str(news_file), news_file.stat().st_mtime)
 
-        # Filter
-        df_filtered = df[~df.index.date.isin(news_dates)].copy()
+        # Filter on local calendar day, as int64 days since epoch
+        local_days = df.index.tz_localize(None).as_unit('ns').asi8 // _NS_PER_DAY
+        df_filtered = df.loc[~np.isin(local_days, news_days)]
         n_removed = len(df) - len(df_filtered)
 
         logger.info(f"Filtered out {n_removed} candles on news dates")
@@ -655,5 +1074,26 @@ def _filter_news_dates(
         return df
 
 
+@lru_cache(maxsize=1)
+def _load_news_days(path: str, mtime: float) -> np.ndarray:
+    """
+    Parse the news calendar into sorted, unique int64 days since epoch.
+
+    Args:
+        path (str): Path to news_calendar.csv
+        mtime (float): File modification time (cache key only)
+
+    Returns:
+        np.ndarray: Read-only int64 day numbers of news dates
+    """
+    news_df = pd.read_csv(path)
+    news_dates = pd.DatetimeIndex(pd.to_datetime(news_df['date']))
+    news_days = np.unique(
+        news_dates.tz_localize(None).as_unit('ns').asi8 // _NS_PER_DAY
+    )
+    news_days.flags.writeable = False
+    return news_days
+
+
 if __name__ == '__main__':
     logger.info("Data module imported successfully")
@@ -11,53 +11,50 @@ All data is retrieved as-is from the database (UTC timestamps).
 Data processing (cleaning, timezone conversion) is handled separately.
 """
 
-import logging
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, contextmanager
 from pathlib import Path
-from typing import Optional, Dict, List
+from datetime import datetime
+from typing import Any, Iterator, NamedTuple, Optional, Dict, List, Tuple
 import ssl
 
 import pandas as pd
-from sqlalchemy import create_engine, text, inspect
-from sqlalchemy.pool import NullPool
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection, make_url
+from sqlalchemy.pool import QueuePool
 
 from shared.config import (
+    CACHE_DIR,
     DATABASE_URL,
     DATABASE_CA_CERT_PATH,
-    LOG_LEVEL,
-    LOGS_DIR,
+    DB_POOL_CONFIG,
+    FETCH_BATCH_SIZE,
+    METADATA_CACHE_TTL_SECONDS,
     get_table_name,
+    setup_logger,
 )
 
 # ============================================================================
 # LOGGING CONFIGURATION
 # ============================================================================
-logger = logging.getLogger(__name__)
-logger.setLevel(getattr(logging, LOG_LEVEL))
-
-# Console handler
-console_handler = logging.StreamHandler()
-console_handler.setLevel(getattr(logging, LOG_LEVEL))
-formatter = logging.Formatter(
-    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-console_handler.setFormatter(formatter)
-logger.addHandler(console_handler)
-
-# File handler
-log_file = LOGS_DIR / 'database_connector.log'
-file_handler = logging.FileHandler(log_file)
-file_handler.setLevel(getattr(logging, LOG_LEVEL))
-file_handler.setFormatter(formatter)
-logger.addHandler(file_handler)
+logger = setup_logger(__name__, 'database_connector.log')
 
 
 # ============================================================================
 # DATABASE CONNECTION MANAGEMENT
 # ============================================================================
 class DatabaseConnection:
-    """Manages PostgreSQL connection with SSL support."""
+    """Manages a pooled PostgreSQL engine with SSL support."""
 
     _engine = None
+    _engine_dsn = None  # DATABASE_URL the cached engine was built for
+    _adbc_pool = None
+    _adbc_dsn = None  # DATABASE_URL the ADBC pool was built for
+    _lock = threading.Lock()
 
     @classmethod
     def get_engine(cls):
@@ -71,7 +68,19 @@ class DatabaseConnection:
             ValueError: If DATABASE_URL or cert path not set
             Exception: If connection fails
         """
-        if cls._engine is None:
+        # The engine is keyed by DSN: if DATABASE_URL is changed (e.g.
+        # patched in tests), a stale engine is never handed out
+        if cls._engine is not None and cls._engine_dsn == DATABASE_URL:
+            return cls._engine
+
+        # Concurrent first calls (fetch_ohlcv_many) must build one engine
+        with cls._lock:
+            if cls._engine is not None:
+                if cls._engine_dsn == DATABASE_URL:
+                    return cls._engine
+                cls._engine.dispose()
+                cls._engine = None
+
             logger.info("Initializing database connection...")
 
             # Prepare connection arguments
@@ -89,15 +98,15 @@ class DatabaseConnection:
                 )
 
             try:
-                cls._engine = create_engine(
+                engine = create_engine(
                     DATABASE_URL,
                     connect_args=connect_args,
-                    poolclass=NullPool,  # Avoid connection pooling issues
                     echo=False,
+                    **DB_POOL_CONFIG,
                 )
 
                 # Test connection
-                with cls._engine.connect() as conn:
+                with engine.connect() as conn:
                     conn.execute(text("SELECT 1"))
                 logger.info("[OK] Database connection successful")
 
@@ -105,16 +114,97 @@ class DatabaseConnection:
                 logger.error(f"[ERROR] Database connection failed: {e}")
                 raise
 
+            # Published only once the probe passed
+            cls._engine_dsn = DATABASE_URL
+            cls._engine = engine
+
         return cls._engine
 
+    @classmethod
+    def get_adbc_pool(cls):
+        """
+        Get or create the pool of ADBC connections.
+
+        Uses the engine's DB_POOL_CONFIG limits, so concurrent fetches
+        (fetch_ohlcv_many) share warm connections instead of paying a TLS
+        and auth handshake per query.
+
+        Returns:
+            sqlalchemy.pool.QueuePool: Pool of ADBC DB-API connections
+
+        Raises:
+            ImportError: If adbc-driver-postgresql is not installed
+        """
+        if cls._adbc_pool is not None and cls._adbc_dsn == DATABASE_URL:
+            return cls._adbc_pool
+
+        import adbc_driver_postgresql.dbapi as adbc_dbapi
+
+        with cls._lock:
+            if cls._adbc_pool is not None:
+                if cls._adbc_dsn == DATABASE_URL:
+                    return cls._adbc_pool
+                cls._adbc_pool.dispose()
+
+            uri = _adbc_uri()
+            # Connections are rolled back when returned, so none sits idle
+            # in a transaction
+            cls._adbc_pool = QueuePool(
+                lambda: adbc_dbapi.connect(uri),
+                pool_size=DB_POOL_CONFIG['pool_size'],
+                max_overflow=DB_POOL_CONFIG['max_overflow'],
+                recycle=DB_POOL_CONFIG['pool_recycle'],
+            )
+            cls._adbc_dsn = DATABASE_URL
+
+        return cls._adbc_pool
+
     @classmethod
     def close(cls):
-        """Close the database connection."""
+        """Close the database connection (disposes all pooled connections)."""
+        if cls._adbc_pool is not None:
+            cls._adbc_pool.dispose()
+            cls._adbc_pool = None
+            cls._adbc_dsn = None
         if cls._engine:
             cls._engine.dispose()
             cls._engine = None
+            cls._engine_dsn = None
             logger.info("Database connection closed")
 
+    @classmethod
+    def reset(cls):
+        """
+        Drop the cached engine without closing its connections.
+
+        For test fixtures and forked worker processes: the parent's pooled
+        sockets are left untouched and the next get_engine() builds a
+        fresh engine.
+        """
+        with cls._lock:
+            if cls._engine is not None:
+                cls._engine.dispose(close=False)
+            cls._engine = None
+            cls._engine_dsn = None
+            # Dropped, not disposed: its connections belong to the parent
+            cls._adbc_pool = None
+            cls._adbc_dsn = None
+
+
+@contextmanager
+def _connection(conn: Optional[Connection] = None):
+    """
+    Yield conn if given, else a pooled connection checked out for the block.
+
+    Lets callers looping over symbols open one connection and pass it to
+    every metadata query instead of checking one out per call.
+    """
+    if conn is not None:
+        yield conn
+        return
+    with DatabaseConnection.get_engine().connect() as new_conn:
+        yield new_conn
+
 
 # ============================================================================
 # DATA RETRIEVAL
@@ -125,6 +215,8 @@ def fetch_ohlcv(
     start_date,
     end_date,
     exchange: str = None,
+    use_cache: bool = False,
+    precision: str = 'float64',
 ) -> pd.DataFrame:
     """
     Fetch raw OHLCV data from PostgreSQL.
@@ -136,9 +228,17 @@ def fetch_ohlcv(
     Args:
         symbol (str): Symbol name (e.g., 'eurusd', 'usa500idxusd')
         timeframe (str): Timeframe (m1, m5, h1)
-        start_date: Start datetime (inclusive)
-        end_date: End datetime (inclusive)
+        start_date: Start datetime (inclusive; naive = UTC)
+        end_date: End datetime (inclusive; naive = UTC)
         exchange (str): Exchange for crypto (optional)
+        use_cache (bool): Serve completed months from the local parquet
+                          cache (CACHE_DIR/ohlcv) and only query the
+                          database for months not cached yet. A month is
+                          cached once symbol_metadata shows it fully loaded
+                          (default: False)
+        precision (str): 'float64' (default) or 'float32' for the price
+                         columns; float32 halves their memory. Volume stays
+                         float64 (large volumes exceed float32's exact range)
 
     Returns:
         pd.DataFrame: Raw OHLCV data with columns:
@@ -146,7 +246,7 @@ def fetch_ohlcv(
                      Sorted by timestamp (ascending)
 
     Raises:
-        ValueError: If symbol/timeframe invalid or data not found
+        ValueError: If symbol/timeframe/precision invalid or data not found
         Exception: If database query fails
     """
     logger.info(
@@ -157,50 +257,35 @@ def fetch_ohlcv(
     # Get table name
     try:
         table_name = get_table_name(symbol, timeframe, exchange)
+        if precision not in ('float64', 'float32'):
+            raise ValueError(
+                f"Unknown precision: {precision}. Available: float64, float32"
+            )
+        # Resolved here, so naive bounds mean UTC on every path (never the
+        # database session time zone)
+        start_date = utc_timestamp(start_date)
+        end_date = utc_timestamp(end_date)
     except ValueError as e:
         logger.error(f"Invalid parameters: {e}")
         raise
 
-    engine = DatabaseConnection.get_engine()
-
-    # Build query
-    query = f"""
-        SELECT
-            timestamp,
-            open,
-            high,
-            low,
-            close,
-            volume
-        FROM
-            {table_name}
-        WHERE
-            timestamp >= %s
-            AND timestamp <= %s
-        ORDER BY
-            timestamp ASC
-    """
-
     try:
-        with engine.connect() as conn:
-            df = pd.read_sql(
-                query,
-                conn,
-                params=(start_date, end_date),
-            )
+        if use_cache:
+            df = _read_ohlcv_cached(table_name, symbol, start_date, end_date)
+        else:
+            df = _read_ohlcv(table_name, (start_date, end_date))
 
         if df.empty:
             logger.warning(
                 f"No data found for {symbol} {timeframe} "
                 f"between {start_date} and {end_date}"
             )
-            return pd.DataFrame(
-                columns=['timestamp', 'open', 'high', 'low', 'close', 'volume']
-            )
+            return pd.DataFrame(columns=_OHLCV_COLUMNS)
 
-        # Ensure timestamp is datetime and set as index
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        df = df.set_index('timestamp')
+        # Ensure timestamp is UTC datetime and set as index
+        df = _ensure_utc_timestamps(df).set_index('timestamp')
+        if precision == 'float32':
+            df = df.astype(dict.fromkeys(_PRICE_COLUMNS, 'float32'))
 
         logger.info(
             f"[OK] Fetched {len(df)} candles "
@@ -213,23 +298,552 @@ def fetch_ohlcv(
         raise
 
 
+def fetch_ohlcv_many(
+    specs: List[Tuple],
+    max_workers: Optional[int] = None,
+) -> List[pd.DataFrame]:
+    """
+    Fetch several OHLCV ranges concurrently.
+
+    Each spec is fetched with fetch_ohlcv() on a worker thread; the drivers
+    release the GIL while waiting on the network, so wall-clock time is
+    close to the slowest single query instead of the sum.
+
+    Args:
+        specs (list): (symbol, timeframe, start_date, end_date[, exchange])
+                      tuples, as fetch_ohlcv() arguments
+        max_workers (int): Concurrent queries (default: pool_size from
+                           DB_POOL_CONFIG)
+
+    Returns:
+        list: DataFrames in the same order as specs
+
+    Raises:
+        ValueError: If a symbol/timeframe is invalid
+        Exception: If any query fails
+    """
+    if not specs:
+        return []
+
+    max_workers = max_workers or DB_POOL_CONFIG['pool_size']
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(specs))) as pool:
+        return list(pool.map(lambda spec: fetch_ohlcv(*spec), specs))
+
+
+_OHLCV_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+_PRICE_COLUMNS = ['open', 'high', 'low', 'close']
+
+# OHLCV range query; placeholders differ per driver (%s for psycopg2,
+# $1/$2 for ADBC). Bounds are always cast to timestamptz so the planner
+# compares against the indexed column's own type (btree range scan).
+_OHLCV_QUERY = """
+    SELECT
+        timestamp,
+        open,
+        high,
+        low,
+        close,
+        volume
+    FROM
+        {table_name}
+    WHERE
+        timestamp >= {start}
+        AND timestamp <= {end}
+    ORDER BY
+        timestamp ASC
+"""
+
+
+def _read_ohlcv(table_name: str, params: tuple) -> pd.DataFrame:
+    """
+    Read an OHLCV range with the fastest available driver.
+
+    Order: ADBC (Arrow-native, binary protocol) -> psycopg2 server-side
+    cursor into Arrow batches -> the same cursor into pandas chunks. A
+    missing or failing ADBC driver falls through to psycopg2.
+
+    Args:
+        table_name (str): OHLCV table
+        params (tuple): (start_date, end_date), both inclusive
+
+    Returns:
+        pd.DataFrame: Columns [timestamp, open, high, low, close, volume]
+    """
+    try:
+        query = _OHLCV_QUERY.format(
+            table_name=table_name, start='$1::timestamptz', end='$2::timestamptz'
+        )
+        return _read_ohlcv_adbc(query, params)
+    except ImportError:
+        logger.debug("ADBC not available, falling back to psycopg2")
+    except Exception as e:
+        # Driver-level failures (SSL/auth options, type mapping) don't mean
+        # the database is unreachable: psycopg2 may still serve the read
+        logger.warning(
+            f"ADBC read of {table_name} failed ({e}), "
+            f"falling back to psycopg2"
+        )
+
+    engine = DatabaseConnection.get_engine()
+    query = _psycopg2_ohlcv_query(table_name)
+    try:
+        return _read_ohlcv_arrow(engine, query, params)
+    except ImportError:
+        logger.debug("pyarrow not available, falling back to pandas records")
+        chunks = list(
+            _iter_ohlcv_frames(engine, query, params, FETCH_BATCH_SIZE)
+        )
+        if not chunks:
+            return pd.DataFrame(columns=_OHLCV_COLUMNS)
+        return pd.concat(chunks, ignore_index=True)
+
+
+def _ensure_utc_timestamps(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Make the 'timestamp' column datetime64[UTC].
+
+    The Arrow readers already declare that dtype in their schema, so their
+    output is returned untouched. Datetime columns that are naive or in
+    another tz are localized/converted in place on the int64 values; only
+    object columns (e.g. datetime objects from psycopg2) are parsed with
+    to_datetime(utc=True).
+    """
+    ts = df['timestamp']
+    ts_dtype = ts.dtype
+    if isinstance(ts_dtype, pd.DatetimeTZDtype):
+        if str(ts_dtype.tz) != 'UTC':
+            df['timestamp'] = ts.dt.tz_convert('UTC')
+    elif pd.api.types.is_datetime64_dtype(ts_dtype):
+        df['timestamp'] = ts.dt.tz_localize('UTC')
+    else:
+        df['timestamp'] = pd.to_datetime(ts, utc=True)
+    return df
+
+
+def _psycopg2_ohlcv_query(table_name: str) -> str:
+    """OHLCV range query with psycopg2 (%s) placeholders."""
+    return _OHLCV_QUERY.format(
+        table_name=table_name, start='%s::timestamptz', end='%s::timestamptz'
+    )
+
+
+def _ohlcv_arrow_schema():
+    """Arrow schema of an OHLCV result (UTC timestamps, float64 values)."""
+    import pyarrow as pa
+
+    return pa.schema([
+        ('timestamp', pa.timestamp('us', tz='UTC')),
+        ('open', pa.float64()),
+        ('high', pa.float64()),
+        ('low', pa.float64()),
+        ('close', pa.float64()),
+        ('volume', pa.float64()),
+    ])
+
+
+def _adbc_uri() -> str:
+    """DATABASE_URL as a plain libpq URI, with the CA cert if present."""
+    url = make_url(DATABASE_URL).set(drivername='postgresql')
+    cert_path = Path(DATABASE_CA_CERT_PATH)
+    if cert_path.exists():
+        url = url.update_query_dict({'sslrootcert': str(cert_path)})
+    return url.render_as_string(hide_password=False)
+
+
+def _read_ohlcv_adbc(query: str, params: tuple) -> pd.DataFrame:
+    """
+    Run an OHLCV query through the ADBC PostgreSQL driver.
+
+    Results arrive as Arrow buffers over the binary COPY protocol, with no
+    per-row Python objects. The connection is borrowed from
+    DatabaseConnection.get_adbc_pool() and returned afterwards.
+
+    Args:
+        query (str): SELECT with $1/$2 placeholders
+        params (tuple): Query parameters
+
+    Returns:
+        pd.DataFrame: Columns [timestamp, open, high, low, close, volume],
+                     timestamp as datetime64[UTC]
+
+    Raises:
+        ImportError: If adbc-driver-postgresql (or pyarrow) is not installed
+    """
+    pool = DatabaseConnection.get_adbc_pool()
+
+    # Bound as text and cast server-side (::timestamptz). The text carries
+    # the UTC offset, so naive bounds never take the session time zone
+    params = tuple(str(utc_timestamp(p)) for p in params)
+
+    # close() on the pooled connection returns it to the pool
+    with closing(pool.connect()) as conn:
+        with closing(conn.cursor()) as cursor:
+            cursor.execute(query, parameters=params)
+            table = cursor.fetch_arrow_table()
+
+    # NUMERIC columns arrive as strings/decimals; cast to the target schema
+    return _arrow_to_pandas(table.cast(_ohlcv_arrow_schema(), safe=False))
+
+
+def _read_ohlcv_arrow(engine, query: str, params: tuple) -> pd.DataFrame:
+    """
+    Stream an OHLCV query through a server-side cursor into an Arrow table.
+
+    Rows are pulled in FETCH_BATCH_SIZE chunks and converted to columnar
+    Arrow arrays per chunk, so the full result is never held as Python rows.
+
+    Args:
+        engine: SQLAlchemy engine (psycopg2 driver)
+        query (str): SELECT returning timestamp, open, high, low, close, volume
+        params (tuple): Query parameters
+
+    Returns:
+        pd.DataFrame: Columns [timestamp, open, high, low, close, volume],
+                     timestamp as datetime64[UTC]
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    import pyarrow as pa
+
+    batches = list(_iter_ohlcv_arrow_batches(engine, query, params, FETCH_BATCH_SIZE))
+    return _arrow_to_pandas(pa.Table.from_batches(batches, schema=_ohlcv_arrow_schema()))
+
+
+def _arrow_to_pandas(table) -> pd.DataFrame:
+    """
+    Convert a freshly fetched Arrow table, releasing it as columns convert.
+
+    split_blocks keeps one block per column (no consolidation copy) and
+    self_destruct frees each Arrow column once converted, so peak memory
+    stays near one copy of the data. The table must not be used afterwards.
+    The later set_index('timestamp') then only detaches the timestamp block.
+    """
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def _iter_ohlcv_rows(engine, query: str, params: tuple, batch_size: int):
+    """
+    Yield an OHLCV query's rows as lists of tuples of up to batch_size.
+
+    Uses a psycopg2 named (server-side) cursor, so the server streams the
+    result instead of the client buffering it whole. The connection is
+    returned to the pool when the generator is exhausted or closed.
+    """
+    raw_conn = engine.raw_connection()
+    try:
+        # Named cursor = server-side cursor (psycopg2)
+        with raw_conn.cursor(name='fetch_ohlcv') as cursor:
+            cursor.itersize = batch_size
+            cursor.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield rows
+    finally:
+        raw_conn.close()
+
+
+def _iter_ohlcv_arrow_batches(engine, query: str, params: tuple, batch_size: int):
+    """
+    Yield an OHLCV query's rows as Arrow RecordBatches of up to batch_size.
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    import pyarrow as pa
+
+    schema = _ohlcv_arrow_schema()
+
+    for rows in _iter_ohlcv_rows(engine, query, params, batch_size):
+        # NUMERIC columns arrive as Decimal; cast to the target schema
+        arrays = [
+            pa.array(column).cast(field.type, safe=False)
+            for column, field in zip(zip(*rows), schema)
+        ]
+        yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _iter_ohlcv_frames(engine, query: str, params: tuple, batch_size: int):
+    """
+    Yield an OHLCV query's rows as DataFrame chunks (no pyarrow needed).
+
+    Timestamps are normalized to UTC per chunk.
+    """
+    for rows in _iter_ohlcv_rows(engine, query, params, batch_size):
+        # coerce_float turns NUMERIC (Decimal) values into float64
+        chunk = pd.DataFrame.from_records(
+            rows, columns=_OHLCV_COLUMNS, coerce_float=True
+        )
+        yield _ensure_utc_timestamps(chunk)
+
+
+def fetch_ohlcv_batches(
+    symbol: str,
+    timeframe: str,
+    start_date,
+    end_date,
+    exchange: str = None,
+    batch_size: int = FETCH_BATCH_SIZE,
+) -> Iterator[pd.DataFrame]:
+    """
+    Fetch raw OHLCV data as a stream of DataFrame chunks.
+
+    Same data as fetch_ohlcv(), but only one chunk is held in memory at a
+    time, so peak memory is bounded by batch_size rather than the range.
+    Use this for multi-year m1 ranges that are processed incrementally.
+
+    Args:
+        symbol (str): Symbol name (e.g., 'eurusd', 'usa500idxusd')
+        timeframe (str): Timeframe (m1, m5, h1)
+        start_date: Start datetime (inclusive; naive = UTC)
+        end_date: End datetime (inclusive; naive = UTC)
+        exchange (str): Exchange for crypto (optional)
+        batch_size (int): Rows per chunk (default: FETCH_BATCH_SIZE)
+
+    Returns:
+        Iterator[pd.DataFrame]: Chunks indexed by UTC timestamp, in
+                                ascending order, columns
+                                [open, high, low, close, volume]
+
+    Raises:
+        ValueError: If symbol/timeframe invalid (raised by this call, not
+                    on the first next())
+        Exception: If database query fails (raised while iterating)
+    """
+    logger.info(
+        f"fetch_ohlcv_batches(): symbol={symbol}, timeframe={timeframe}, "
+        f"start={start_date}, end={end_date}, batch_size={batch_size}"
+    )
+
+    # Validated before the generator is created, so bad arguments fail at
+    # the call site; the query only runs once iteration starts
+    table_name = get_table_name(symbol, timeframe, exchange)
+    params = (utc_timestamp(start_date), utc_timestamp(end_date))
+    return _iter_ohlcv_batches(table_name, params, batch_size)
+
+
+def _iter_ohlcv_batches(
+    table_name: str, params: tuple, batch_size: int
+) -> Iterator[pd.DataFrame]:
+    """Stream an OHLCV range as timestamp-indexed chunks (see fetch_ohlcv_batches)."""
+    engine = DatabaseConnection.get_engine()
+    query = _psycopg2_ohlcv_query(table_name)
+
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        logger.debug("pyarrow not available, falling back to pandas records")
+        for chunk in _iter_ohlcv_frames(engine, query, params, batch_size):
+            yield chunk.set_index('timestamp')
+        return
+
+    for batch in _iter_ohlcv_arrow_batches(engine, query, params, batch_size):
+        yield batch.to_pandas(split_blocks=True).set_index('timestamp')
+
+
+# ============================================================================
+# OHLCV WINDOW CACHE
+# ============================================================================
+# Raw fetches are cached per table and calendar month (UTC) as parquet.
+# A month is only stored once it is fully loaded: it must lie before the
+# current month and before the month of the symbol's
+# last_available_timestamp (symbol_metadata), so ingestion lag never
+# freezes a truncated month. Each table's cache records the metadata it was
+# built against and is dropped when last_available_timestamp or
+# total_records move (new data or a backfill).
+_OHLCV_CACHE_DIR = CACHE_DIR / 'ohlcv'
+
+
+def _read_ohlcv_cached(
+    table_name: str, symbol: str, start_date, end_date
+) -> pd.DataFrame:
+    """
+    Read an OHLCV range, serving completed months from the parquet cache.
+
+    Uncached months are fetched from the database in contiguous runs (whole
+    months, so they can be stored) and the completed ones are cached.
+
+    Args:
+        table_name (str): OHLCV table
+        symbol (str): Symbol name (symbol_metadata lookup)
+        start_date: Start datetime (inclusive; naive = UTC)
+        end_date: End datetime (inclusive; naive = UTC)
+
+    Returns:
+        pd.DataFrame: Columns [timestamp, open, high, low, close, volume]
+    """
+    try:
+        metadata = get_symbol_metadata(symbol)
+    except ValueError:
+        metadata = None
+    if metadata is None or metadata.last_available_timestamp is None:
+        logger.warning(
+            f"No metadata for {symbol}, reading {table_name} without cache"
+        )
+        return _read_ohlcv(table_name, (start_date, end_date))
+
+    # Months before cache_until are complete in the database
+    loaded_until = utc_timestamp(metadata.last_available_timestamp)
+    cache_until = min(
+        month_start(loaded_until), month_start(pd.Timestamp.now(tz='UTC'))
+    )
+    _sync_cache_stamp(table_name, metadata)
+
+    start = utc_timestamp(start_date)
+    end = utc_timestamp(end_date)
+    months = pd.date_range(month_start(start), month_start(end), freq='MS')
+
+    frames = []
+    run = []  # consecutive months still to fetch
+    for month in months:
+        cached = _load_month(table_name, month) if month < cache_until else None
+        if cached is None:
+            run.append(month)
+            continue
+        if run:
+            frames.append(_fetch_months(table_name, run, cache_until))
+            run = []
+        frames.append(cached)
+    if run:
+        frames.append(_fetch_months(table_name, run, cache_until))
+
+    df = pd.concat(frames, ignore_index=True)
+    df = _ensure_utc_timestamps(df)
+    ts = df['timestamp']
+    return df.loc[(ts >= start) & (ts <= end)].reset_index(drop=True)
+
+
+def _fetch_months(table_name: str, months: list, cache_until) -> pd.DataFrame:
+    """Fetch consecutive whole months and cache those before cache_until."""
+    run_end = months[-1] + pd.offsets.MonthBegin(1)
+    df = _read_ohlcv(table_name, (months[0], run_end - pd.Timedelta(1, 'us')))
+    df = _ensure_utc_timestamps(df)
+    logger.debug(
+        f"Fetched {table_name} {months[0]:%Y-%m}..{months[-1]:%Y-%m} "
+        f"({len(df)} rows)"
+    )
+
+    ts = df['timestamp']
+    for month in months:
+        if month < cache_until:
+            next_month = month + pd.offsets.MonthBegin(1)
+            _save_month(table_name, month, df.loc[(ts >= month) & (ts < next_month)])
+    return df
+
+
+def _sync_cache_stamp(table_name: str, metadata: 'SymbolMetadata') -> None:
+    """
+    Drop a table's cached months if its symbol metadata moved since caching.
+
+    The stamp (last_available_timestamp, total_records) is stored next to
+    the months as {table_name}.json.
+    """
+    stamp = {
+        'last_available_timestamp': str(
+            utc_timestamp(metadata.last_available_timestamp)
+        ),
+        'total_records': int(metadata.total_records),
+    }
+    stamp_path = _OHLCV_CACHE_DIR / f"{table_name}.json"
+    try:
+        if stamp_path.exists():
+            if json.loads(stamp_path.read_text()) == stamp:
+                return
+            for path in _OHLCV_CACHE_DIR.glob(_month_cache_glob(table_name)):
+                path.unlink()
+            logger.info(f"{table_name} metadata changed, cached months dropped")
+        _OHLCV_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        stamp_path.write_text(json.dumps(stamp))
+    except Exception as e:
+        logger.warning(f"Could not check cache stamp {stamp_path.name}: {e}")
+
+
+def _month_cache_glob(table_name: str) -> str:
+    """Glob matching every cached month of one table (and no other table)."""
+    return f"{table_name}_{'[0-9]' * 6}.parquet"
+
+
+def _month_cache_path(table_name: str, month) -> Path:
+    """Parquet path of one cached table-month."""
+    return _OHLCV_CACHE_DIR / f"{table_name}_{month:%Y%m}.parquet"
+
+
+def _load_month(table_name: str, month) -> Optional[pd.DataFrame]:
+    """Load a cached table-month, or None if not cached/unreadable."""
+    path = _month_cache_path(table_name, month)
+    if not path.exists():
+        return None
+    try:
+        return pd.read_parquet(path)
+    except Exception as e:
+        logger.warning(f"Could not read cache {path.name}: {e}")
+        return None
+
+
+def _save_month(table_name: str, month, df: pd.DataFrame) -> None:
+    """Write a table-month atomically; failures only log a warning."""
+    path = _month_cache_path(table_name, month)
+    tmp_path = path.with_suffix('.tmp')
+    try:
+        _OHLCV_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        df.reset_index(drop=True).to_parquet(tmp_path, compression='zstd')
+        os.replace(tmp_path, path)
+    except ImportError:
+        logger.warning("pyarrow not available, skipping OHLCV cache")
+    except Exception as e:
+        logger.warning(f"Could not write cache {path.name}: {e}")
+
+
+def clear_ohlcv_cache() -> None:
+    """Delete all cached OHLCV months (e.g. after historical data is corrected)."""
+    for pattern in ('*.parquet', '*.json'):
+        for path in _OHLCV_CACHE_DIR.glob(pattern):
+            path.unlink()
+    logger.info("OHLCV cache cleared")
+
+
+# ============================================================================
+# DATE HELPERS
+# ============================================================================
+def utc_timestamp(value) -> pd.Timestamp:
+    """Parse a datetime-like as a UTC Timestamp (naive values are UTC)."""
+    ts = pd.Timestamp(value)
+    return ts.tz_localize('UTC') if ts.tz is None else ts.tz_convert('UTC')
+
+
+def month_start(ts: pd.Timestamp) -> pd.Timestamp:
+    """First instant of a UTC Timestamp's calendar month."""
+    return ts.normalize().replace(day=1)
+
+
 # ============================================================================
 # SYMBOL METADATA
 # ============================================================================
-def get_symbol_metadata(symbol: str) -> Dict:
+class SymbolMetadata(NamedTuple):
+    """One row of the symbol_metadata table."""
+    symbol: str
+    asset_type: str  # crypto/tradfi
+    total_records: int
+    last_available_timestamp: datetime
+    can_update_from: datetime
+
+
+def get_symbol_metadata(
+    symbol: str, conn: Optional[Connection] = None
+) -> SymbolMetadata:
     """
     Fetch metadata for a symbol from symbol_metadata table.
 
     Args:
         symbol (str): Symbol name
+        conn (Connection): Open connection to reuse (optional)
 
     Returns:
-        dict: Metadata with keys:
-              - symbol
-              - asset_type (crypto/tradfi)
-              - total_records
-              - last_available_timestamp
-              - can_update_from
+        SymbolMetadata: Record with fields symbol, asset_type,
+                        total_records, last_available_timestamp,
+                        can_update_from (use ._asdict() for a dict)
 
     Raises:
         ValueError: If symbol not found
@@ -237,8 +851,6 @@ def get_symbol_metadata(symbol: str) -> Dict:
     """
     logger.info(f"Fetching metadata for {symbol}...")
 
-    engine = DatabaseConnection.get_engine()
-
     query = """
         SELECT
             symbol,
@@ -249,12 +861,12 @@ def get_symbol_metadata(symbol: str) -> Dict:
         FROM
             symbol_metadata
         WHERE
-            symbol = %s
+            symbol = :symbol
     """
 
     try:
-        with engine.connect() as conn:
-            result = conn.execute(
+        with _connection(conn) as c:
+            result = c.execute(
                 text(query),
                 {"symbol": symbol.lower()}
             )
@@ -263,15 +875,9 @@ def get_symbol_metadata(symbol: str) -> Dict:
         if not row:
             raise ValueError(f"Symbol '{symbol}' not found in metadata table")
 
-        metadata = {
-            'symbol': row[0],
-            'asset_type': row[1],
-            'total_records': row[2],
-            'last_available_timestamp': row[3],
-            'can_update_from': row[4],
-        }
+        metadata = SymbolMetadata(*row)
 
-        logger.info(f"[OK] Metadata fetched: {metadata['total_records']} records")
+        logger.info(f"[OK] Metadata fetched: {metadata.total_records} records")
         return metadata
 
     except Exception as e:
@@ -279,43 +885,110 @@ def get_symbol_metadata(symbol: str) -> Dict:
         raise
 
 
+# ============================================================================
+# METADATA CACHE
+# ============================================================================
+# (kind, table_name) -> (monotonic time stored, value)
+_metadata_cache: Dict[tuple, tuple] = {}
+
+
+def _cache_get(key: tuple) -> Any:
+    """Return a cached metadata value, or None if missing or stale."""
+    hit = _metadata_cache.get(key)
+    if hit is not None and time.monotonic() - hit[0] < METADATA_CACHE_TTL_SECONDS:
+        return hit[1]
+    return None
+
+
+def _cache_put(key: tuple, value: Any) -> None:
+    """Store a metadata value (only successful lookups are stored)."""
+    _metadata_cache[key] = (time.monotonic(), value)
+
+
+def invalidate_metadata_cache() -> None:
+    """Drop cached table lists, availability checks and date ranges.
+
+    Call after ingesting new data to see it before the TTL expires.
+    """
+    _metadata_cache.clear()
+
+
+def _ohlcv_table_names(conn: Optional[Connection] = None) -> List[str]:
+    """
+    Sorted OHLCV table names (cached).
+
+    Filtered in the catalog query, so only matching names cross the wire
+    regardless of how many other tables the database holds.
+    """
+    tables = _cache_get(('ohlcv_tables',))
+    if tables is None:
+        with _connection(conn) as c:
+            tables = c.execute(
+                text(
+                    "SELECT c.relname FROM pg_catalog.pg_class c "
+                    "WHERE c.relkind IN ('r', 'p') "
+                    "AND c.relname ILIKE '%ohlcv%' "
+                    "AND pg_catalog.pg_table_is_visible(c.oid) "
+                    "ORDER BY c.relname"
+                )
+            ).scalars().all()
+        _cache_put(('ohlcv_tables',), tables)
+    return tables
+
+
 # ============================================================================
 # AVAILABILITY CHECKS
 # ============================================================================
-def check_symbol_availability(symbol: str, timeframe: str) -> bool:
+def check_symbol_availability(
+    symbol: str,
+    timeframe: str,
+    conn: Optional[Connection] = None,
+) -> bool:
     """
     Check if data is available for a symbol/timeframe combination.
 
     Args:
         symbol (str): Symbol name
         timeframe (str): Timeframe
+        conn (Connection): Open connection to reuse (optional)
 
     Returns:
         bool: True if table exists and has data, False otherwise
+              (positive results are cached for METADATA_CACHE_TTL_SECONDS)
     """
-    engine = DatabaseConnection.get_engine()
-
     try:
         table_name = get_table_name(symbol, timeframe)
-        inspector = inspect(engine)
-        tables = inspector.get_table_names()
-
-        if table_name not in tables:
-            logger.warning(f"Table not found: {table_name}")
-            return False
-
-        # Check if table has data
-        with engine.connect() as conn:
-            result = conn.execute(
-                text(f"SELECT COUNT(*) FROM {table_name}")
-            )
-            count = result.scalar()
-
-        if count == 0:
+        if _cache_get(('available', table_name)):
+            return True
+
+        with _connection(conn) as c:
+            # Catalog lookup (indexed on relname) instead of listing every table;
+            # reltuples is the planner's row estimate (-1 if never analyzed)
+            estimate = c.execute(
+                text(
+                    "SELECT c.reltuples::bigint FROM pg_catalog.pg_class c "
+                    "WHERE c.relname = :name AND c.relkind IN ('r', 'p') "
+                    "AND pg_catalog.pg_table_is_visible(c.oid)"
+                ),
+                {"name": table_name},
+            ).scalar()
+
+            if estimate is None:
+                logger.warning(f"Table not found: {table_name}")
+                return False
+
+            # Check if table has data (stops at the first row, no full scan)
+            has_rows = c.execute(
+                text(f"SELECT EXISTS (SELECT 1 FROM {table_name})")
+            ).scalar()
+
+        if not has_rows:
             logger.warning(f"Table {table_name} is empty")
             return False
 
-        logger.info(f"[OK] {table_name} available ({count} rows)")
+        rows = f"~{estimate} rows" if estimate >= 0 else "row count not analyzed"
+        logger.info(f"[OK] {table_name} available ({rows})")
+        _cache_put(('available', table_name), True)
         return True
 
     except Exception as e:
@@ -323,59 +996,58 @@ def check_symbol_availability(symbol: str, timeframe: str) -> bool:
         return False
 
 
-def get_available_tables() -> List[str]:
+def get_available_tables(conn: Optional[Connection] = None) -> List[str]:
     """
     Get list of all available OHLCV tables in the database.
 
+    Args:
+        conn (Connection): Open connection to reuse (optional)
+
     Returns:
         list: Table names
     """
-    engine = DatabaseConnection.get_engine()
-
     try:
-        inspector = inspect(engine)
-        all_tables = inspector.get_table_names()
-
-        # Filter for OHLCV tables (containing 'ohlcv' in name)
-        ohlcv_tables = [t for t in all_tables if 'ohlcv' in t.lower()]
+        # OHLCV tables = names containing 'ohlcv'
+        ohlcv_tables = _ohlcv_table_names(conn)
 
         logger.info(f"Found {len(ohlcv_tables)} OHLCV tables")
-        return sorted(ohlcv_tables)
+        return list(ohlcv_tables)
 
     except Exception as e:
         logger.error(f"Error getting available tables: {e}")
         return []
 
 
-def get_date_range(symbol: str, timeframe: str) -> Dict:
+def get_date_range(
+    symbol: str,
+    timeframe: str,
+    conn: Optional[Connection] = None,
+) -> Dict:
     """
     Get available date range for a symbol/timeframe.
 
     Args:
         symbol (str): Symbol name
         timeframe (str): Timeframe
+        conn (Connection): Open connection to reuse (optional)
 
     Returns:
-        dict: With keys 'start' and 'end' (datetime objects)
+        dict: With keys 'start' and 'end' (datetime objects),
+              cached for METADATA_CACHE_TTL_SECONDS
 
     Raises:
         ValueError: If symbol/timeframe not found
     """
-    engine = DatabaseConnection.get_engine()
-
     try:
         table_name = get_table_name(symbol, timeframe)
+        cached = _cache_get(('date_range', table_name))
+        if cached is not None:
+            return dict(cached)
 
-        query = f"""
-            SELECT
-                MIN(timestamp) as start,
-                MAX(timestamp) as end
-            FROM
-                {table_name}
-        """
+        query = f"SELECT {_date_range_columns(table_name)}"
 
-        with engine.connect() as conn:
-            result = conn.execute(text(query))
+        with _connection(conn) as c:
+            result = c.execute(text(query))
             row = result.fetchone()
 
         if not row or row[0] is None:
@@ -390,12 +1062,90 @@ def get_date_range(symbol: str, timeframe: str) -> Dict:
             f"[OK] Date range for {symbol} {timeframe}: "
             f"{date_range['start']} to {date_range['end']}"
         )
-        return date_range
+        _cache_put(('date_range', table_name), date_range)
+        return dict(date_range)
 
     except Exception as e:
         logger.error(f"Error getting date range: {e}")
         raise
 
 
+def get_date_ranges(
+    pairs: List[Tuple[str, str]],
+    conn: Optional[Connection] = None,
+) -> Dict[Tuple[str, str], Dict]:
+    """
+    Get available date ranges for several symbol/timeframe pairs at once.
+
+    All uncached tables are probed in a single UNION ALL query, so N pairs
+    cost one database round-trip instead of N.
+
+    Args:
+        pairs (list): (symbol, timeframe) tuples
+        conn (Connection): Open connection to reuse (optional)
+
+    Returns:
+        dict: (symbol, timeframe) -> {'start', 'end'} (as get_date_range).
+              Pairs whose table has no data are omitted (with a warning).
+
+    Raises:
+        ValueError: If a symbol/timeframe is not configured
+    """
+    tables = {pair: get_table_name(*pair) for pair in pairs}
+
+    ranges = {}
+    for table_name in dict.fromkeys(tables.values()):
+        cached = _cache_get(('date_range', table_name))
+        if cached is not None:
+            ranges[table_name] = cached
+    missing = [t for t in dict.fromkeys(tables.values()) if t not in ranges]
+
+    if missing:
+        query = "\nUNION ALL\n".join(
+            f"SELECT {i} as idx, {_date_range_columns(table_name)}"
+            for i, table_name in enumerate(missing)
+        )
+
+        try:
+            with _connection(conn) as c:
+                rows = c.execute(text(query)).fetchall()
+        except Exception as e:
+            logger.error(f"Error getting date ranges: {e}")
+            raise
+
+        for idx, start, end in rows:
+            if start is None:
+                continue
+            table_name = missing[idx]
+            ranges[table_name] = {
+                'start': pd.Timestamp(start),
+                'end': pd.Timestamp(end),
+            }
+            _cache_put(('date_range', table_name), ranges[table_name])
+
+    result = {}
+    for pair, table_name in tables.items():
+        if table_name in ranges:
+            result[pair] = dict(ranges[table_name])
+        else:
+            logger.warning(f"No data found for {pair[0]} {pair[1]}")
+
+    logger.info(f"[OK] Date ranges for {len(result)}/{len(tables)} pairs")
+    return result
+
+
+def _date_range_columns(table_name: str) -> str:
+    """
+    SELECT list returning a table's first and last timestamp as start/end.
+
+    Uses ORDER BY ... LIMIT 1 subqueries: two index probes, never an
+    aggregate over the table.
+    """
+    return (
+        f"(SELECT timestamp FROM {table_name} ORDER BY timestamp ASC LIMIT 1) as start, "
+        f"(SELECT timestamp FROM {table_name} ORDER BY timestamp DESC LIMIT 1) as end"
+    )
+
+
 if __name__ == '__main__':
     logger.info("Database connector module imported successfully")
@@ -0,0 +1,54 @@
+-- ============================================================================
+-- OHLCV INDEX MAINTENANCE
+-- ============================================================================
+-- Every read in shared/database_connector.py is
+--   SELECT timestamp, open, high, low, close, volume
+--   WHERE timestamp >= .. AND timestamp <= .. ORDER BY timestamp
+-- The timestamp primary key already gives a range scan; a covering index
+-- (INCLUDE all selected columns) turns it into an Index Only Scan with no
+-- heap fetches once the visibility map is current (VACUUM).
+--
+-- Run with psql (\gexec executes each generated statement on its own, which
+-- CREATE INDEX CONCURRENTLY and VACUUM require):
+--   psql "$DATABASE_URL" -f sql/ohlcv_indexes.sql
+--
+-- Safe to re-run: indexes are created IF NOT EXISTS.
+
+-- Covering btree index on every OHLCV table
+SELECT format(
+    'CREATE INDEX CONCURRENTLY IF NOT EXISTS %I ON %I (timestamp) '
+    'INCLUDE (open, high, low, close, volume)',
+    'ix_' || c.relname || '_ts_cov',
+    c.relname
+)
+FROM pg_catalog.pg_class c
+WHERE c.relkind = 'r'
+  AND c.relname LIKE '%\_ohlcv'
+  AND pg_catalog.pg_table_is_visible(c.oid)
+ORDER BY c.relname
+\gexec
+
+-- m1 tables are append-only in timestamp order: a BRIN index is a tiny
+-- (kilobytes) alternative for wide range scans
+SELECT format(
+    'CREATE INDEX CONCURRENTLY IF NOT EXISTS %I ON %I USING BRIN (timestamp) '
+    'WITH (pages_per_range = 16)',
+    'ix_' || c.relname || '_ts_brin',
+    c.relname
+)
+FROM pg_catalog.pg_class c
+WHERE c.relkind = 'r'
+  AND c.relname LIKE '%\_m1\_%\_ohlcv'
+  AND pg_catalog.pg_table_is_visible(c.oid)
+ORDER BY c.relname
+\gexec
+
+-- Refresh statistics and the visibility map (needed for index-only scans).
+-- Re-run this section after every bulk ingest.
+SELECT format('VACUUM (ANALYZE) %I', c.relname)
+FROM pg_catalog.pg_class c
+WHERE c.relkind = 'r'
+  AND c.relname LIKE '%\_ohlcv'
+  AND pg_catalog.pg_table_is_visible(c.oid)
+ORDER BY c.relname
+\gexec
@@ -0,0 +1,151 @@
+"""
+Unit tests for shared/data_handler.py
+
+Test coverage:
+  - Result cache keys (date normalization, config and news fingerprint)
+  - Result cache storage and reuse in get_clean_market_data()
+
+Fetching and processing are stubbed: no test reaches a real database.
+"""
+
+import os
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+import pandas as pd
+
+from shared.data_handler import _cache_path, get_clean_market_data
+from shared.config import MICE_CONFIG
+
+
+_START = datetime(2024, 1, 1)
+_END = datetime(2024, 1, 5)
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def result_cache(tmp_path):
+    """Point the result cache at a temporary directory."""
+    with patch('shared.data_handler.CACHE_DIR', tmp_path):
+        yield tmp_path
+
+
+@pytest.fixture
+def stub_pipeline(sample_ohlcv_df):
+    """Stub fetch_ohlcv (serving sample_ohlcv_df) and process_data."""
+    calls = []
+
+    def fake_fetch(symbol, timeframe, start_date, end_date, use_cache=False):
+        calls.append((symbol, timeframe, start_date, end_date))
+        return sample_ohlcv_df
+
+    def fake_process(df, **kwargs):
+        return df
+
+    with patch('shared.data_handler.fetch_ohlcv', fake_fetch), \
+            patch('shared.data_handler.process_data', fake_process):
+        yield calls
+
+
+# ============================================================================
+# CACHE KEY TESTS
+# ============================================================================
+
+class TestCacheKey:
+    """Test _cache_path() keying."""
+
+    def test_equal_instants_share_key(self):
+        """Test that strings, datetimes and Timestamps of one instant match."""
+        paths = {
+            _cache_path('eurusd', 'h1', start, '2024-02-01', True, False)
+            for start in (
+                '2024-01-01',
+                datetime(2024, 1, 1),
+                pd.Timestamp('2024-01-01', tz='UTC'),
+                pd.Timestamp('2024-01-01 01:00', tz='Europe/Berlin'),
+            )
+        }
+        assert len(paths) == 1
+
+    def test_different_range_misses(self):
+        """Test that a different range gets a different key."""
+        assert _cache_path('eurusd', 'h1', _START, _END, True, False) != \
+            _cache_path('eurusd', 'h1', _START, datetime(2024, 1, 6), True, False)
+
+    def test_mice_config_change_misses(self):
+        """Test that a MICE_CONFIG change invalidates the key."""
+        before = _cache_path('eurusd', 'h1', _START, _END, True, False)
+        changed = {**MICE_CONFIG, 'max_iter': MICE_CONFIG['max_iter'] + 1}
+
+        with patch('shared.data_handler.MICE_CONFIG', changed):
+            after = _cache_path('eurusd', 'h1', _START, _END, True, False)
+
+        assert before != after
+
+    def test_news_file_mtime_change_misses(self, tmp_path, monkeypatch):
+        """Test that editing news_calendar.csv invalidates exclude_news keys."""
+        monkeypatch.chdir(tmp_path)
+        news_file = tmp_path / 'news_calendar.csv'
+        news_file.write_text('date\n2024-01-03\n')
+        os.utime(news_file, (1_700_000_000, 1_700_000_000))
+        before = _cache_path('eurusd', 'h1', _START, _END, True, True)
+        unfiltered = _cache_path('eurusd', 'h1', _START, _END, True, False)
+
+        os.utime(news_file, (1_700_000_100, 1_700_000_100))
+
+        assert _cache_path('eurusd', 'h1', _START, _END, True, True) != before
+        # Without exclude_news the file is irrelevant
+        assert _cache_path('eurusd', 'h1', _START, _END, True, False) == unfiltered
+
+
+# ============================================================================
+# RESULT CACHE TESTS
+# ============================================================================
+
+class TestResultCache:
+    """Test get_clean_market_data(use_cache=True)."""
+
+    def test_completed_range_cached_and_reused(self, result_cache, stub_pipeline):
+        """Test that a past range is stored once and then served from disk."""
+        df1, meta1 = get_clean_market_data(
+            'eurusd', 'h1', _START, _END, local_time=False, use_cache=True
+        )
+        assert len(list(result_cache.glob('*.parquet'))) == 1
+
+        df2, meta2 = get_clean_market_data(
+            'eurusd', 'h1', '2024-01-01', '2024-01-05', local_time=False,
+            use_cache=True,
+        )
+
+        assert len(stub_pipeline) == 1
+        pd.testing.assert_frame_equal(df2, df1, check_freq=False)
+        assert meta2['date_range_start'] == meta1['date_range_start']
+        assert meta2['clean_candles'] == meta1['clean_candles']
+
+    def test_current_month_range_not_stored(self, result_cache, stub_pipeline):
+        """Test that a range reaching the current month is never stored."""
+        now = pd.Timestamp.now(tz='UTC')
+
+        get_clean_market_data(
+            'eurusd', 'h1', _START, now, local_time=False, use_cache=True
+        )
+        get_clean_market_data(
+            'eurusd', 'h1', _START, now, local_time=False, use_cache=True
+        )
+
+        assert not any(result_cache.iterdir())
+        assert len(stub_pipeline) == 2
+
+    def test_cache_disabled_by_default(self, result_cache, stub_pipeline):
+        """Test that nothing is stored without use_cache."""
+        get_clean_market_data('eurusd', 'h1', _START, _END, local_time=False)
+
+        assert not any(result_cache.iterdir())
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])